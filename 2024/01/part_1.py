@@ -1,31 +1,61 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser, Namespace
+from collections import Counter
+from collections.abc import Iterator
 
+CHUNK_BYTES: int = 1 << 20
 
-def read_input(filepath: str) -> tuple[list[int], list[int]]:
-    left: list[int] = []
-    right: list[int] = []
+
+def read_input(filepath: str) -> tuple[Counter[int], Counter[int]]:
+    """
+    Streams the lists into histograms a chunk of lines at a time. Location IDs
+    are bounded so this holds one entry per distinct ID, not one per line.
+    """
+    left: Counter[int] = Counter()
+    right: Counter[int] = Counter()
     with open(filepath, "r") as file:
-        for line in file:
-            nums: list[str] = line.split(" ")
-            left.append(int(nums[0]))
-            right.append(int(nums[-1][:-1]))
-    left.sort()
-    right.sort()
+        while chunk := file.readlines(CHUNK_BYTES):
+            nums: list[int] = list(map(int, "".join(chunk).split()))
+            left.update(nums[0::2])
+            right.update(nums[1::2])
     return left, right
 
 
+def _in_order(histogram: Counter[int]) -> Iterator[list[int]]:
+    for location in sorted(histogram):
+        yield [location, histogram[location]]
+
+
+def distance(left: Counter[int], right: Counter[int]) -> int:
+    """
+    Pairs the nth smallest IDs of each list, as sorting both lists would, by
+    walking both histograms in order and matching up their counts
+    """
+    lefts: Iterator[list[int]] = _in_order(left)
+    rights: Iterator[list[int]] = _in_order(right)
+    output: int = 0
+    l: list[int] | None = next(lefts, None)
+    r: list[int] | None = next(rights, None)
+    while l is not None and r is not None:
+        pairs: int = min(l[1], r[1])
+        output += pairs * abs(l[0] - r[0])
+        l[1] -= pairs
+        r[1] -= pairs
+        if l[1] == 0:
+            l = next(lefts, None)
+        if r[1] == 0:
+            r = next(rights, None)
+    return output
+
+
 def main(input_path: str) -> int:
     left, right = read_input(input_path)
-    distance: int = 0
-    for n in range(len(left)):
-        distance += abs(left[n] - right[n])
-    return distance
+    return distance(left, right)
 
 
 if __name__ == "__main__":
     parser: ArgumentParser = ArgumentParser()
     parser.add_argument(dest="path", nargs=1)
     args: Namespace = parser.parse_args()
-    distance: int = main(args.path[0])
-    print(f"The total distance is {distance}")
+    total: int = main(args.path[0])
+    print(f"The total distance is {total}")
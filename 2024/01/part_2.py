@@ -1,23 +1,32 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser, Namespace
+from collections import Counter
 
+CHUNK_BYTES: int = 1 << 20
 
-def read_input(filepath: str) -> tuple[list[int], list[int]]:
-    left: list[int] = []
-    right: list[int] = []
+
+def read_input(filepath: str) -> tuple[Counter[int], Counter[int]]:
+    """
+    Streams the lists into histograms a chunk of lines at a time. Location IDs
+    are bounded so this holds one entry per distinct ID, not one per line.
+    """
+    left: Counter[int] = Counter()
+    right: Counter[int] = Counter()
     with open(filepath, "r") as file:
-        for line in file:
-            nums: list[str] = line.split(" ")
-            left.append(int(nums[0]))
-            right.append(int(nums[-1][:-1]))
+        while chunk := file.readlines(CHUNK_BYTES):
+            nums: list[int] = list(map(int, "".join(chunk).split()))
+            left.update(nums[0::2])
+            right.update(nums[1::2])
     return left, right
 
 
 def main(input_path: str) -> int:
     left, right = read_input(input_path)
+    if len(right) < len(left):
+        left, right = right, left
     similarity: int = 0
-    for location in left:
-        similarity += location * right.count(location)
+    for location, count in left.items():
+        similarity += location * count * right[location]
     return similarity
 
 
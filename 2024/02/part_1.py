@@ -1,43 +1,61 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser, Namespace
-from collections.abc import Callable, Iterator
+from array import array
+from itertools import accumulate, chain, repeat
+from operator import sub
 import logging
+import re
 
+CHUNK_BYTES: int = 1 << 20
+UP: str = "+"
+DOWN: str = "-"
+UNSAFE: str = "x"
+END: str = "|"
+STEP_CODES: dict[int, str] = {
+    1: UP,
+    2: UP,
+    3: UP,
+    -1: DOWN,
+    -2: DOWN,
+    -3: DOWN,
+}
+# A whole report of UP steps or of DOWN steps, between END markers
+SAFE_REPORT: re.Pattern[str] = re.compile(r"(?:^|(?<=\|))(?:\+*|-*)(?=\||$)")
 
-def read_input(filepath: str) -> Iterator[list[int]]:
-    logging.debug(f"Reading {filepath}")
+
+def read_input(filepath: str) -> tuple[array, list[int]]:
+    """
+    Every level of every report in one flat buffer. Report n is
+    levels[offsets[n] : offsets[n + 1]].
+    """
+    logging.debug("Reading %s", filepath)
+    levels: array = array("l")
+    sizes: list[int] = []
     with open(filepath, "r") as file:
-        lines: list[str] = file.read().splitlines()
-    for line in lines:
-        yield [int(value) for value in line.split(" ")]
-
-
-def is_report_valid(report: list[int]) -> bool:
-    if report[1] > report[0]:
-        is_dir_valid: Callable = lambda prev, curr: prev < curr
-    else:
-        is_dir_valid: Callable = lambda prev, curr: prev > curr
-    for n in range(1, len(report)):
-        prev: int = report[n - 1]
-        curr: int = report[n]
-        distance: int = abs(prev - curr)
-        if distance < 1 or distance > 3:
-            logging.debug(f"- Report {report} {prev} {curr} invalid distance")
-            return False
-        if not is_dir_valid(prev, curr):
-            logging.debug(f"- Report {report} {prev} {curr} changes direction")
-            return False
-    logging.debug(f"+ Report {report}")
-    return True
+        while chunk := file.readlines(CHUNK_BYTES):
+            reports: list[list[str]] = list(map(str.split, chunk))
+            sizes.extend(map(len, reports))
+            levels.extend(map(int, chain.from_iterable(reports)))
+    return levels, list(accumulate(sizes, initial=0))
+
+
+def step_codes(levels: array, offsets: list[int]) -> str:
+    """
+    One char per adjacent pair of levels across the whole buffer: UP, DOWN or
+    UNSAFE, with END in place of the step from one report into the next. The
+    deltas and their codes are computed in bulk so the rules can be checked
+    with string operations on whole reports.
+    """
+    deltas: map[int] = map(sub, levels[1:], levels)
+    codes: list[str] = list(map(STEP_CODES.get, deltas, repeat(UNSAFE)))
+    for end in offsets[1:-1]:
+        codes[end - 1] = END
+    return "".join(codes)
 
 
 def main(input_path: str) -> int:
-    safe_reports: int = 0
-    for report in read_input(input_path):
-        valid: bool = is_report_valid(report)
-        if valid:
-            safe_reports += 1
-    return safe_reports
+    levels, offsets = read_input(input_path)
+    return len(SAFE_REPORT.findall(step_codes(levels, offsets)))
 
 
 if __name__ == "__main__":
@@ -1,27 +1,96 @@
 #!/usr/bin/env python3
 from argparse import ArgumentParser, Namespace
-from re import findall
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from math import inf
+import os
+import re
 
-PATTERN: str = r"mul\((\d{1,3}),(\d{1,3})\)"
+PATTERN: re.Pattern[bytes] = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)")
+MAX_TOKEN_BYTES: int = len(b"mul(999,999)")
+CHUNK_BYTES: int = 1 << 20
 
 
-def read_data(filepath: str) -> str:
-    with open(filepath, "r") as file:
-        return file.read()
+def read_data(
+    filepath: str,
+    start: int = 0,
+    end: int | float = inf,
+) -> Iterator[bytes]:
+    with open(filepath, "rb") as file:
+        file.seek(start)
+        while chunk := file.read(min(CHUNK_BYTES, end - file.tell())):
+            yield chunk
 
 
-def main(input_path: str) -> int:
+def instructions(
+    chunks: Iterable[bytes],
+    lookahead: bytes = b"",
+) -> Iterator[re.Match[bytes]]:
+    """
+    Every instruction in order, scanning each chunk once. The unscanned tail
+    of a chunk that could still start an instruction is carried into the next.
+    `lookahead` is only used to finish one started in the last chunk.
+    """
+    carry: bytes = b""
+    for chunk in chunks:
+        buffer: bytes = carry + chunk
+        end: int = 0
+        for match in PATTERN.finditer(buffer):
+            yield match
+            end = match.end()
+        carry = buffer[max(end, len(buffer) - MAX_TOKEN_BYTES + 1) :]
+    for match in PATTERN.finditer(carry + lookahead):
+        if match.start() >= len(carry):
+            break
+        yield match
+
+
+def summarize(filepath: str, start: int, end: int) -> int:
+    """Total of the instructions starting in [start, end)"""
+    with open(filepath, "rb") as file:
+        file.seek(end)
+        lookahead: bytes = file.read(MAX_TOKEN_BYTES - 1)
+    total: int = 0
+    for instruction in instructions(read_data(filepath, start, end), lookahead):
+        total += int(instruction[1]) * int(instruction[2])
+    return total
+
+
+def byte_ranges(filepath: str, count: int) -> list[tuple[int, int]]:
+    size: int = os.path.getsize(filepath)
+    bounds: list[int] = [size * n // count for n in range(count + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def read_parallel(filepath: str, workers: int) -> int:
+    starts, ends = zip(*byte_ranges(filepath, workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(summarize, repeat(filepath), starts, ends))
+
+
+def main(input_path: str, workers: int = 1) -> int:
+    if workers > 1 and os.path.getsize(input_path) > CHUNK_BYTES:
+        return read_parallel(input_path, workers)
     total: int = 0
-    instruction_set: str = read_data(input_path)
-    instructions: list[str] = findall(PATTERN, instruction_set)
-    for instruction in instructions:
-        total += int(instruction[0]) * int(instruction[1])
+    for instruction in instructions(read_data(input_path)):
+        total += int(instruction[1]) * int(instruction[2])
     return total
 
 
 if __name__ == "__main__":
     parser: ArgumentParser = ArgumentParser()
     parser.add_argument(dest="path", nargs=1)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count() or 1,
+        default=1,
+        dest="workers",
+        help="Scan in a process pool. Without a value uses every core",
+    )
     args: Namespace = parser.parse_args()
-    total: int = main(args.path[0])
+    total: int = main(args.path[0], args.workers)
     print(f"The total is {total}")
@@ -1,49 +1,140 @@
 #!/usr/bin/env python3
 from argparse import ArgumentParser, Namespace
-from re import Match, search
-
-DO_PATTERN: str = r"do\(\)"
-DONT_PATTERN: str = r"don't\(\)"
-MUL_PATTERN: str = r"mul\((\d{1,3}),(\d{1,3})\)"
-
-
-def read_data(filepath: str) -> str:
-    with open(filepath, "r") as file:
-        return file.read()
-
-
-def read_instructions(
-    instructions: str,
-    enabled: bool = True,
-    total: int = 0,
-) -> int:
-    if not enabled:
-        next_do: Match | None = search(DO_PATTERN, instructions)
-        if next_do is None:
-            return total
-        return read_instructions(instructions[next_do.end() :], total=total)
-    next_mul: Match | None = search(MUL_PATTERN, instructions)
-    if next_mul is None:
-        return total
-    next_dont: Match | None = search(DONT_PATTERN, instructions)
-    if next_dont is not None and next_dont.start() < next_mul.start():
-        return read_instructions(
-            instructions[next_dont.end() :],
-            enabled=False,
-            total=total,
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from math import inf
+import os
+import re
+
+type Summary = tuple[int, int, bool | None]
+
+DO: bytes = b"do()"
+DONT: bytes = b"don't()"
+TOKEN_PATTERN: re.Pattern[bytes] = re.compile(
+    rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)"
+)
+MAX_TOKEN_BYTES: int = len(b"mul(999,999)")
+CHUNK_BYTES: int = 1 << 20
+
+
+def read_data(
+    filepath: str,
+    start: int = 0,
+    end: int | float = inf,
+) -> Iterator[bytes]:
+    with open(filepath, "rb") as file:
+        file.seek(start)
+        while chunk := file.read(min(CHUNK_BYTES, end - file.tell())):
+            yield chunk
+
+
+def tokens(
+    chunks: Iterable[bytes],
+    lookahead: bytes = b"",
+) -> Iterator[re.Match[bytes]]:
+    """
+    Every token in order, scanning each chunk once. The unscanned tail of a
+    chunk that could still be the start of a token is carried into the next.
+    Tokens cannot overlap, so a match is never cut short by a chunk boundary.
+    `lookahead` is only used to finish a token started in the last chunk.
+    """
+    carry: bytes = b""
+    for chunk in chunks:
+        buffer: bytes = carry + chunk
+        end: int = 0
+        for match in TOKEN_PATTERN.finditer(buffer):
+            yield match
+            end = match.end()
+        carry = buffer[max(end, len(buffer) - MAX_TOKEN_BYTES + 1) :]
+    for match in TOKEN_PATTERN.finditer(carry + lookahead):
+        if match.start() >= len(carry):
+            break
+        yield match
+
+
+def read_instructions(chunks: Iterable[bytes], enabled: bool = True) -> int:
+    total: int = 0
+    for token in tokens(chunks):
+        if token[0] == DO:
+            enabled = True
+        elif token[0] == DONT:
+            enabled = False
+        elif enabled:
+            total += int(token[1]) * int(token[2])
+    return total
+
+
+def summarize(filepath: str, start: int, end: int) -> Summary:
+    """
+    Totals of the tokens starting in [start, end) for both states the range
+    could start in, and the state it leaves (None if it never switches). Both
+    states agree from the first do() or don't() on.
+    """
+    with open(filepath, "rb") as file:
+        file.seek(end)
+        lookahead: bytes = file.read(MAX_TOKEN_BYTES - 1)
+    if_enabled: int = 0
+    if_disabled: int = 0
+    state: bool | None = None
+    for token in tokens(read_data(filepath, start, end), lookahead):
+        if token[0] == DO:
+            state = True
+        elif token[0] == DONT:
+            state = False
+        elif state is None:
+            if_enabled += int(token[1]) * int(token[2])
+        elif state:
+            product: int = int(token[1]) * int(token[2])
+            if_enabled += product
+            if_disabled += product
+    return if_enabled, if_disabled, state
+
+
+def merge(summaries: Iterable[Summary], enabled: bool = True) -> int:
+    total: int = 0
+    for if_enabled, if_disabled, state in summaries:
+        total += if_enabled if enabled else if_disabled
+        if state is not None:
+            enabled = state
+    return total
+
+
+def byte_ranges(filepath: str, count: int) -> list[tuple[int, int]]:
+    size: int = os.path.getsize(filepath)
+    bounds: list[int] = [size * n // count for n in range(count + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def read_parallel(filepath: str, workers: int) -> int:
+    """Summarises a byte range per worker, then merges them in order"""
+    starts, ends = zip(*byte_ranges(filepath, workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries: Iterator[Summary] = executor.map(
+            summarize, repeat(filepath), starts, ends
         )
-    total += int(next_mul[1]) * int(next_mul[2])
-    return read_instructions(instructions[next_mul.end() :], total=total)
+        return merge(summaries)
 
 
-def main(input_path: str) -> int:
-    instructions: str = read_data(input_path)[:-1]
-    return read_instructions(instructions)
+def main(input_path: str, workers: int = 1) -> int:
+    if workers > 1 and os.path.getsize(input_path) > CHUNK_BYTES:
+        return read_parallel(input_path, workers)
+    return read_instructions(read_data(input_path))
 
 
 if __name__ == "__main__":
     parser: ArgumentParser = ArgumentParser()
     parser.add_argument(dest="path", nargs=1)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count() or 1,
+        default=1,
+        dest="workers",
+        help="Scan in a process pool. Without a value uses every core",
+    )
     args: Namespace = parser.parse_args()
-    total: int = main(args.path[0])
+    total: int = main(args.path[0], args.workers)
     print(f"The total is {total}")
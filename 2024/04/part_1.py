@@ -1,60 +1,83 @@
 #!/usr/bin/env python3
 from argparse import ArgumentParser, Namespace
-from collections.abc import Callable
+from collections.abc import Iterator
+import re
 
 WORD: str = "XMAS"
-DIRECTIONS: dict[str, Callable] = {
-    "N": lambda x, y, n: (x, y - n),
-    "NE": lambda x, y, n: (x + n, y - n),
-    "E": lambda x, y, n: (x + n, y),
-    "SE": lambda x, y, n: (x + n, y + n),
-    "S": lambda x, y, n: (x, y + n),
-    "SW": lambda x, y, n: (x - n, y + n),
-    "W": lambda x, y, n: (x - n, y),
-    "NW": lambda x, y, n: (x - n, y - n),
-}
-
-
-def read_input(filepath: str) -> list[list[str]]:
+SEPARATOR: str = "\n"
+
+
+def read_input(filepath: str) -> str:
+    """The grid as one string, each row followed by the separator"""
     with open(filepath, "r") as file:
-        return [list(line[:-1]) for line in file.readlines()]
+        text: str = file.read()
+    if not text.endswith(SEPARATOR):
+        text += SEPARATOR
+    return text
+
+
+def lines(grid: str) -> Iterator[str]:
+    """
+    Every row, column and diagonal of the grid. Rows are `stride` apart, so a
+    slice with step stride - 1, stride or stride + 1 walks down-left, down or
+    down-right. Stepping off either edge lands on a separator, so each slice
+    holds many lines without any word running from one into the next.
+    """
+    stride: int = grid.index(SEPARATOR) + 1
+    yield grid
+    for step in (stride - 1, stride, stride + 1):
+        for start in range(step):
+            yield grid[start::step]
 
 
-def is_match(grid: list[list[str]], direction: str, x: int, y: int) -> bool:
-    for n in range(1, len(WORD)):
-        next_x, next_y = DIRECTIONS[direction](x, y, n)
-        if 0 > next_x or next_x >= len(grid[0]):
-            return False
-        if 0 > next_y or next_y >= len(grid):
-            return False
-        next_char: str = grid[next_y][next_x]
-        if next_char != WORD[n]:
-            return False
-    return True
+def word_pattern(words: list[str]) -> re.Pattern[str]:
+    """
+    Finds every position where any of the words starts. The lookaheads do not
+    consume anything, so overlapping words and words that are prefixes of one
+    another are all captured, one group per word.
+    """
+    alternatives: str = "|".join(map(re.escape, words))
+    groups: str = "".join(f"(?:(?=({re.escape(word)})))?" for word in words)
+    return re.compile(f"(?={alternatives}){groups}")
 
 
-def count_matches(grid: list[list[str]], x: int, y: int) -> int:
-    directions: dict[str, int] = {
-        direction: is_match(grid, direction, x, y)
-        for direction in DIRECTIONS.keys()
-    }
-    return sum(directions.values())
+def count_words(grid: str, words: list[str]) -> dict[str, int]:
+    """
+    Counts every word read in any of the eight directions in one pass over
+    each line. A palindrome reads the same both ways so counts twice.
+    """
+    patterns: list[str] = list(dict.fromkeys(words + [w[::-1] for w in words]))
+    pattern: re.Pattern[str] = word_pattern(patterns)
+    found: list[int] = [0] * len(patterns)
+    for line in lines(grid):
+        for match in pattern.finditer(line):
+            for n, group in enumerate(match.groups()):
+                if group is not None:
+                    found[n] += 1
+    counts: dict[str, int] = dict.fromkeys(words, 0)
+    for word in counts:
+        counts[word] += found[patterns.index(word)]
+        counts[word] += found[patterns.index(word[::-1])]
+    return counts
 
 
-def main(input_path: str) -> int:
-    counter: int = 0
-    grid: list[list[str]] = read_input(input_path)
-    for y, line in enumerate(grid):
-        for x, char in enumerate(line):
-            if char != "X":
-                continue
-            counter += count_matches(grid, x, y)
-    return counter
+def main(input_path: str, words: list[str] | None = None) -> int:
+    grid: str = read_input(input_path)
+    return sum(count_words(grid, words or [WORD]).values())
 
 
 if __name__ == "__main__":
     parser: ArgumentParser = ArgumentParser()
     parser.add_argument(dest="path", nargs=1)
+    parser.add_argument(
+        "-w",
+        "--word",
+        nargs="+",
+        default=[WORD],
+        dest="words",
+        help=f"Words to search for. Defaults to {WORD}",
+    )
     args: Namespace = parser.parse_args()
-    matches: int = main(args.path[0])
-    print(f"There are {matches} matches")
+    counts: dict[str, int] = count_words(read_input(args.path[0]), args.words)
+    for word, count in counts.items():
+        print(f"There are {count} matches of {word}")
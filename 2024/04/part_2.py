@@ -1,38 +1,149 @@
 #!/usr/bin/env python3
 from argparse import ArgumentParser, Namespace
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from math import inf
+import os
 
-WORD: str = "MAS"
+type Stencil = tuple[bytes, ...]
+type Check = tuple[int, int, int]
 
+SIZE: int = 3
+WILDCARD: int = ord(".")
+X_MAS: Stencil = (b"M.S", b".A.", b"M.S")
 
-def read_input(filepath: str) -> list[list[str]]:
-    with open(filepath, "r") as file:
-        return [list(line[:-1]) for line in file.readlines()]
 
+def rotations(stencil: Stencil) -> list[Stencil]:
+    """Each distinct quarter turn, so symmetric shapes only count once"""
+    shapes: list[Stencil] = []
+    for _ in range(4):
+        if stencil not in shapes:
+            shapes.append(stencil)
+        stencil = tuple(bytes(column) for column in zip(*stencil[::-1]))
+    return shapes
 
-def is_match(grid: list[list[str]], x: int, y: int) -> bool:
-    diagonal_1: list[str] = [grid[y - 1][x - 1], grid[y][x], grid[y + 1][x + 1]]
-    if "".join(diagonal_1) not in [WORD, WORD[::-1]]:
-        return False
-    diagonal_2: list[str] = [grid[y - 1][x + 1], grid[y][x], grid[y + 1][x - 1]]
-    if "".join(diagonal_2) not in [WORD, WORD[::-1]]:
-        return False
-    return True
 
+def checks(stencil: Stencil) -> list[Check]:
+    """(row, column, char) of every non wildcard cell of the stencil"""
+    return [
+        (dy, dx, char)
+        for dy, row in enumerate(stencil)
+        for dx, char in enumerate(row)
+        if char != WILDCARD
+    ]
 
-def main(input_path: str) -> int:
-    counter: int = 0
-    grid: list[list[str]] = read_input(input_path)
-    for y in range(1, len(grid) - 1):
-        for x in range(1, len(grid[y]) - 1):
-            if grid[y][x] != "A":
-                continue
-            counter += int(is_match(grid, x, y))
-    return counter
+
+def read_rows(
+    filepath: str,
+    start: int = 0,
+    stop: int | float = inf,
+) -> Iterator[bytes]:
+    """Rows start up to stop, seeking straight to the first one"""
+    with open(filepath, "rb") as file:
+        stride: int = len(file.readline())
+        file.seek(start * stride)
+        rows: Iterator[bytes] = (line.rstrip(b"\r\n") for line in file)
+        yield from rows if stop == inf else islice(rows, int(stop - start))
+
+
+def row_masks(row: bytes, tables: dict[int, bytes]) -> dict[int, int]:
+    """
+    One int per char with a 1 in the low bit of each byte holding the char, so
+    a whole row is compared at once. The first column is the highest byte.
+    """
+    return {
+        char: int.from_bytes(row.translate(table), "big")
+        for char, table in tables.items()
+    }
+
+
+def count_rows(
+    filepath: str,
+    stencils: list[Stencil],
+    start: int = 0,
+    stop: int | float = inf,
+) -> int:
+    """
+    Counts the stencils whose top row is in [start, stop), keeping only the
+    masks of the last SIZE rows. Shifting a row's mask left by dx bytes lines
+    column x + dx up with column x, so ANDing the shifted masks of every check
+    leaves a bit wherever the whole stencil matches.
+    """
+    shapes: list[list[Check]] = [checks(stencil) for stencil in stencils]
+    chars: set[int] = {char for shape in shapes for _, _, char in shape}
+    tables: dict[int, bytes] = {
+        char: bytes(int(n == char) for n in range(256)) for char in chars
+    }
+    window: deque[dict[int, int]] = deque(maxlen=SIZE)
+    anchors: int = 0
+    total: int = 0
+    for row in read_rows(filepath, start, stop + SIZE - 1):
+        if not anchors:
+            anchors = int.from_bytes(b"\x01" * (len(row) - SIZE + 1), "big")
+            anchors <<= 8 * (SIZE - 1)
+        window.append(row_masks(row, tables))
+        if len(window) < SIZE:
+            continue
+        for shape in shapes:
+            matches: int = anchors
+            for dy, dx, char in shape:
+                matches &= window[dy][char] << (8 * dx)
+            total += matches.bit_count()
+    return total
+
+
+def count_parallel(filepath: str, stencils: list[Stencil], workers: int) -> int:
+    """Splits the rows into one band per worker, overlapping by SIZE - 1"""
+    with open(filepath, "rb") as file:
+        stride: int = len(file.readline())
+    height: int = os.path.getsize(filepath) // stride
+    bounds: list[int] = [height * n // workers for n in range(workers + 1)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(
+            executor.map(
+                count_rows,
+                repeat(filepath),
+                repeat(stencils),
+                bounds,
+                bounds[1:],
+            )
+        )
+
+
+def main(
+    input_path: str,
+    workers: int = 1,
+    stencil: Stencil = X_MAS,
+) -> int:
+    stencils: list[Stencil] = rotations(stencil)
+    if workers > 1:
+        return count_parallel(input_path, stencils, workers)
+    return count_rows(input_path, stencils)
 
 
 if __name__ == "__main__":
     parser: ArgumentParser = ArgumentParser()
     parser.add_argument(dest="path", nargs=1)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count() or 1,
+        default=1,
+        dest="workers",
+        help="Count in a process pool. Without a value uses every core",
+    )
+    parser.add_argument(
+        "-s",
+        "--stencil",
+        nargs=SIZE,
+        type=str.encode,
+        default=X_MAS,
+        help="Rows of a 3x3 shape to count in every rotation, . matches any",
+    )
     args: Namespace = parser.parse_args()
-    matches: int = main(args.path[0])
+    matches: int = main(args.path[0], args.workers, tuple(args.stencil))
     print(f"There are {matches} matches")
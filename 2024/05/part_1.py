@@ -1,47 +1,144 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser, Namespace
+from collections.abc import Iterator
+from hashlib import sha256
+from pathlib import Path
+from typing import TextIO
+import os
+import struct
 
+type Rules = dict[int, int]
 
-def read_input(filepath: str) -> tuple[dict[int, set[int]], list[list[int]]]:
-    with open(filepath, "r") as file:
-        lines: list[str] = file.readlines()
-    rules: dict[int, set[int]] = {}
-    updates: list[list[int]] = []
+CACHE_DIR: Path = Path(__file__).resolve().parents[2] / ".cache" / "rules"
+CACHE_ENTRIES: int = 64
+# Bump whenever dump_rules changes, so older matrices are never loaded
+RULES_FORMAT: int = 1
+HEADER: struct.Struct = struct.Struct("<I")
+
+
+def compile_rules(lines: list[str]) -> Rules:
+    """
+    Compiles the rule block into a precedence index: for each page, a bitset
+    of the pages that have to come after it, with bit n standing for page n
+    """
+    rules: Rules = {}
     for line in lines:
-        if "|" in line:
-            pages: list[str] = line[:-1].split("|")
-            key: int = int(pages[0])
-            if key not in rules:
-                rules[key] = set()
-            rules[key].add(int(pages[1]))
+        before, after = line.split("|")
+        rules[int(before)] = rules.get(int(before), 0) | 1 << int(after)
+    return rules
+
+
+def dump_rules(rules: Rules) -> bytes:
+    """The index as a dense bit matrix: the page count, then a row per page"""
+    pages: int = max(rules, default=-1) + 1
+    pages = max([pages] + [after.bit_length() for after in rules.values()])
+    row_bytes: int = (pages + 7) // 8
+    rows: list[int] = [rules.get(page, 0) for page in range(pages)]
+    matrix: bytes = b"".join(row.to_bytes(row_bytes, "little") for row in rows)
+    return HEADER.pack(pages) + matrix
+
+
+def load_rules(data: bytes) -> Rules:
+    (pages,) = HEADER.unpack_from(data)
+    row_bytes: int = (pages + 7) // 8
+    if len(data) != HEADER.size + pages * row_bytes:
+        raise ValueError("Truncated rule matrix")
+    rules: Rules = {}
+    for page in range(pages):
+        start: int = HEADER.size + page * row_bytes
+        after: int = int.from_bytes(data[start : start + row_bytes], "little")
+        if after:
+            rules[page] = after
+    return rules
+
+
+def read_rules(file: TextIO, cache_dir: Path | None = CACHE_DIR) -> Rules:
+    """
+    Reads the rule block, reusing the index compiled by an earlier run for the
+    same block when there is one. Entries are named by the block's hash and
+    written atomically, so concurrent runs and workers can share them. Setting
+    AOC_NO_CACHE skips the cache, as `python -m aoc run --no-cache` does.
+    """
+    lines: list[str] = []
+    for line in file:
+        if "|" not in line:
+            break
+        lines.append(line)
+    if cache_dir is None or os.environ.get("AOC_NO_CACHE"):
+        return compile_rules(lines)
+    key: str = sha256("".join(lines).encode()).hexdigest()
+    path: Path = cache_dir / f"v{RULES_FORMAT}_{key}.bin"
+    try:
+        rules: Rules = load_rules(path.read_bytes())
+        os.utime(path)
+        return rules
+    except (FileNotFoundError, ValueError, struct.error):
+        pass
+    rules: Rules = compile_rules(lines)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    temporary: Path = path.with_suffix(f".{os.getpid()}.tmp")
+    temporary.write_bytes(dump_rules(rules))
+    temporary.replace(path)
+    prune_rules(cache_dir)
+    return rules
+
+
+def prune_rules(cache_dir: Path) -> None:
+    """Removes the least recently used entries past CACHE_ENTRIES"""
+    entries: list[tuple[float, Path]] = []
+    for path in cache_dir.glob("*.bin"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            continue
+    entries.sort(reverse=True)
+    for _, path in entries[CACHE_ENTRIES:]:
+        path.unlink(missing_ok=True)
+
+
+def read_updates(file: TextIO) -> Iterator[list[int]]:
+    for line in file:
         if "," in line:
-            update: list[int] = [int(page) for page in line[:-1].split(",")]
-            updates.append(update)
-    return rules, updates
+            yield [int(page) for page in line.split(",")]
 
 
-def is_valid_update(rules: dict[int, set[int]], update: list[int]) -> bool:
-    for page in range(1, len(update)):
-        previous_pages: set[int] = set(update[:page])
-        forbidden_pages: set[int] = rules.get(update[page], set())
-        if previous_pages & forbidden_pages:
+def is_valid_update(rules: Rules, update: list[int]) -> bool:
+    """One pass, failing on any page that must come after one already seen"""
+    seen: int = 0
+    for page in update:
+        if rules.get(page, 0) & seen:
             return False
+        seen |= 1 << page
     return True
 
 
-def main(input_path: str) -> int:
-    rules, updates = read_input(input_path)
+def main(input_path: str, cache_dir: Path | None = CACHE_DIR) -> int:
     counter: int = 0
-    for update in updates:
-        if not is_valid_update(rules, update):
-            continue
-        counter += update[int(len(update) / 2)]
+    with open(input_path, "r") as file:
+        rules: Rules = read_rules(file, cache_dir)
+        for update in read_updates(file):
+            if not is_valid_update(rules, update):
+                continue
+            counter += update[len(update) // 2]
     return counter
 
 
 if __name__ == "__main__":
     parser: ArgumentParser = ArgumentParser()
     parser.add_argument(dest="path", nargs=1)
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=CACHE_DIR,
+        help="Where compiled rule sets are kept between runs",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_const",
+        const=None,
+        dest="cache_dir",
+        help="Always compile the rules",
+    )
     args: Namespace = parser.parse_args()
-    total: int = main(args.path[0])
+    total: int = main(args.path[0], args.cache_dir)
     print(f"The sum of middle digits is {total}")
@@ -1,91 +1,115 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser, Namespace
-from collections.abc import Callable, Iterator
-from itertools import cycle
+from bisect import bisect_left, bisect_right
+import re
+
+type XY = tuple[int, int]
+
+UP, RIGHT, DOWN, LEFT = range(4)
+OBSTACLE: re.Pattern[str] = re.compile("#")
+UNKNOWN: re.Pattern[str] = re.compile(r"[^.#^\n]")
 
 
 class Patrol:
-    DIRECTIONS: Iterator[Callable] = cycle(
-        [
-            lambda coordinates: (coordinates[0], coordinates[1] - 1),
-            lambda coordinates: (coordinates[0] + 1, coordinates[1]),
-            lambda coordinates: (coordinates[0], coordinates[1] + 1),
-            lambda coordinates: (coordinates[0] - 1, coordinates[1]),
-        ]
-    )
+    """
+    Obstacles are kept as sorted positions per row and per column, so the
+    guard jumps straight to the cell before the next obstacle with a bisect.
+    Visited cells are marked a whole span at a time in a flat byte grid.
+    """
 
     def __init__(
         self,
         start_x: int,
         start_y: int,
-        max_x: int,
-        max_y: int,
-        obstacles: set[tuple[int, int]],
+        width: int,
+        height: int,
+        obstacles: list[XY],
     ) -> None:
-        self.turn()
         self.x: int = start_x
         self.y: int = start_y
-        self.max_x: int = max_x
-        self.max_y: int = max_y
-        self.obstacles: set[tuple[int, int]] = obstacles
-        self.visited: set[tuple[int, int]] = {self.position}
+        self.direction: int = UP
+        self.width: int = width
+        self.height: int = height
+        self.rows: list[list[int]] = [[] for _ in range(height)]
+        self.columns: list[list[int]] = [[] for _ in range(width)]
+        for x, y in sorted(obstacles):
+            self.rows[y].append(x)
+            self.columns[x].append(y)
+        self.visited: bytearray = bytearray(width * height)
 
-    @property
-    def position(self) -> tuple[int, int]:
-        return (self.x, self.y)
+    def stop(self, x: int, y: int, direction: int) -> tuple[int, int, bool]:
+        """Where the guard stops moving from (x, y), and if it left the map"""
+        if direction == UP:
+            column: list[int] = self.columns[x]
+            n: int = bisect_left(column, y)
+            return (x, 0, True) if n == 0 else (x, column[n - 1] + 1, False)
+        if direction == DOWN:
+            column: list[int] = self.columns[x]
+            n: int = bisect_right(column, y)
+            if n == len(column):
+                return x, self.height - 1, True
+            return x, column[n] - 1, False
+        row: list[int] = self.rows[y]
+        if direction == LEFT:
+            n: int = bisect_left(row, x)
+            return (0, y, True) if n == 0 else (row[n - 1] + 1, y, False)
+        n: int = bisect_right(row, x)
+        if n == len(row):
+            return self.width - 1, y, True
+        return row[n] - 1, y, False
 
-    def turn(self) -> None:
-        self.direction: Callable = next(self.DIRECTIONS)
+    def mark(self, x: int, y: int) -> None:
+        """Marks every cell from the guard's position to (x, y)"""
+        start: int = min(self.y, y) * self.width + min(self.x, x)
+        end: int = max(self.y, y) * self.width + max(self.x, x) + 1
+        step: int = 1 if y == self.y else self.width
+        cells: int = len(range(start, end, step))
+        self.visited[start:end:step] = b"\x01" * cells
 
     def move(self) -> bool:
-        next_x, next_y = self.direction(self.position)
-        if 0 > next_x or next_x > self.max_x:
-            return False
-        if 0 > next_y or next_y > self.max_y:
-            return False
-        if (next_x, next_y) in self.obstacles:
-            self.turn()
-            return self.move()
-        self.x: int = next_x
-        self.y: int = next_y
-        if self.position not in self.visited:
-            self.visited.add(self.position)
-        return True
+        """Walks to the next obstacle and turns. False once off the map."""
+        x, y, left = self.stop(self.x, self.y, self.direction)
+        self.mark(x, y)
+        self.x = x
+        self.y = y
+        self.direction = (self.direction + 1) % 4
+        return not left
 
 
 def read_input(filepath: str) -> Patrol:
     with open(filepath, "r") as file:
-        lines: list[str] = file.readlines()
-    start_position: tuple[int, int] = (0, 0)
-    obstacles: set[tuple[int, int]] = set()
+        lines: list[str] = file.read().splitlines()
+    start_position: XY | None = None
+    obstacles: list[XY] = []
     for y, line in enumerate(lines):
-        for x, char in enumerate(line[:-1]):
-            if char == ".":
-                continue
-            if char == "^":
-                start_position: tuple[int, int] = (x, y)
-                continue
-            if char == "#":
-                obstacles.add((x, y))
-                continue
-            raise ValueError(f"Unknown char {char} at ({x}, {y})")
-    if start_position == (0, 0):
+        unknown: re.Match[str] | None = UNKNOWN.search(line)
+        if unknown is not None:
+            x: int = unknown.start()
+            raise ValueError(f"Unknown char {unknown[0]} at ({x}, {y})")
+        for match in OBSTACLE.finditer(line):
+            obstacles.append((match.start(), y))
+        if (x := line.find("^")) != -1:
+            start_position = (x, y)
+    if start_position is None:
         raise ValueError("Start position not found")
     return Patrol(
         start_x=start_position[0],
         start_y=start_position[1],
-        max_x=len(lines[0][:-1]) - 1,
-        max_y=len(lines) - 1,
+        width=len(lines[0]),
+        height=len(lines),
         obstacles=obstacles,
     )
 
 
 def main(input_path: str) -> int:
-    is_in_bounds: bool = True
     patrol: Patrol = read_input(input_path)
-    while is_in_bounds:
-        is_in_bounds: bool = patrol.move()
-    return len(patrol.visited)
+    turns: set[tuple[int, int, int]] = set()
+    while patrol.move():
+        turn: tuple[int, int, int] = (patrol.x, patrol.y, patrol.direction)
+        if turn in turns:
+            raise ValueError("The guard never leaves the map")
+        turns.add(turn)
+    return patrol.visited.count(1)
 
 
 if __name__ == "__main__":
@@ -1,129 +1,175 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser, Namespace
-from collections.abc import Callable, Iterator
-from itertools import cycle
+from bisect import bisect_left, bisect_right, insort
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import logging
+import os
+import re
+
+type XY = tuple[int, int]
+type State = tuple[int, int, int]
+
+UP, RIGHT, DOWN, LEFT = range(4)
+STEPS: list[XY] = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+OBSTACLE: re.Pattern[str] = re.compile("#")
+UNKNOWN: re.Pattern[str] = re.compile(r"[^.#^\n]")
 
 
 class Patrol:
-    DIRECTIONS: list[Callable] = [
-        lambda x, y: (x, y - 1),
-        lambda x, y: (x + 1, y),
-        lambda x, y: (x, y + 1),
-        lambda x, y: (x - 1, y),
-    ]
+    """
+    Obstacles are kept as sorted positions per row and per column, so the
+    guard jumps straight to the cell before the next obstacle with a bisect
+    """
 
     def __init__(
         self,
         start_x: int,
         start_y: int,
-        max_x: int,
-        max_y: int,
-        obstacles: set[tuple[int, int]],
+        width: int,
+        height: int,
+        obstacles: list[XY],
     ) -> None:
-        self.start_x: int = start_x
-        self.start_y: int = start_y
-        self.max_x: int = max_x
-        self.max_y: int = max_y
-        self.obstacles: set[tuple[int, int]] = obstacles
-        self.reset()
-
-    @property
-    def position(self) -> tuple[int, int, Callable]:
-        return (self.x, self.y, self.direction)
-
-    @property
-    def is_in_bounds(self) -> bool:
-        if 0 > self.x or self.x > self.max_x:
-            return False
-        if 0 > self.y or self.y > self.max_y:
-            return False
-        return True
-
-    def reset(self) -> None:
-        self.x: int = self.start_x
-        self.y: int = self.start_y
-        self.directions: Iterator[Callable] = cycle(self.DIRECTIONS)
-        self.direction: Callable = next(self.directions)
-        self.visited: set[tuple[int, int, Callable]] = {self.position}
-
-    def turn(self) -> None:
-        logging.debug("Changing directions")
-        self.direction: Callable = next(self.directions)
-
-    def move(self) -> bool:
-        next_x, next_y = self.direction(self.x, self.y)
-        logging.info(f"Moving from ({self.x},{self.y}) to ({next_x},{next_y})")
-        if (next_x, next_y) in self.obstacles:
-            logging.debug(
-                f"Obstacle encountered at ({next_x},{next_y}) "
-                f"from ({self.x},{self.y})"
-            )
-            self.turn()
-            return self.move()
-        self.x: int = next_x
-        self.y: int = next_y
-        if self.position not in self.visited:
-            self.visited.add(self.position)
-            return False
-        return True
+        self.start: State = (start_x, start_y, UP)
+        self.width: int = width
+        self.height: int = height
+        self.rows: list[list[int]] = [[] for _ in range(height)]
+        self.columns: list[list[int]] = [[] for _ in range(width)]
+        for x, y in sorted(obstacles):
+            self.rows[y].append(x)
+            self.columns[x].append(y)
+
+    def stop(self, x: int, y: int, direction: int) -> tuple[int, int, bool]:
+        """Where the guard stops moving from (x, y), and if it left the map"""
+        if direction == UP:
+            column: list[int] = self.columns[x]
+            n: int = bisect_left(column, y)
+            return (x, 0, True) if n == 0 else (x, column[n - 1] + 1, False)
+        if direction == DOWN:
+            column: list[int] = self.columns[x]
+            n: int = bisect_right(column, y)
+            if n == len(column):
+                return x, self.height - 1, True
+            return x, column[n] - 1, False
+        row: list[int] = self.rows[y]
+        if direction == LEFT:
+            n: int = bisect_left(row, x)
+            return (0, y, True) if n == 0 else (row[n - 1] + 1, y, False)
+        n: int = bisect_right(row, x)
+        if n == len(row):
+            return self.width - 1, y, True
+        return row[n] - 1, y, False
+
+    def add_obstacle(self, x: int, y: int) -> None:
+        insort(self.rows[y], x)
+        insort(self.columns[x], y)
+
+    def remove_obstacle(self, x: int, y: int) -> None:
+        self.rows[y].remove(x)
+        self.columns[x].remove(y)
+
+    def route(self) -> dict[XY, State]:
+        """
+        Every cell on the guard's route, with the state it was in just before
+        first stepping onto it. The start cell maps to the starting state.
+        """
+        x, y, direction = self.start
+        first: dict[XY, State] = {(x, y): self.start}
+        turns: set[State] = set()
+        while True:
+            stop_x, stop_y, left = self.stop(x, y, direction)
+            dx, dy = STEPS[direction]
+            while (x, y) != (stop_x, stop_y):
+                first.setdefault((x + dx, y + dy), (x, y, direction))
+                x, y = x + dx, y + dy
+            if left:
+                return first
+            if (x, y, direction) in turns:
+                raise ValueError("The guard never leaves the map")
+            turns.add((x, y, direction))
+            direction = (direction + 1) % 4
+
+    def is_looping(self, state: State) -> bool:
+        """A loop repeats a turn, so only the turns need remembering"""
+        x, y, direction = state
+        turns: set[State] = set()
+        while True:
+            x, y, left = self.stop(x, y, direction)
+            if left:
+                return False
+            if (x, y, direction) in turns:
+                return True
+            turns.add((x, y, direction))
+            direction = (direction + 1) % 4
 
 
 def read_input(filepath: str) -> Patrol:
     with open(filepath, "r") as file:
-        lines: list[str] = file.readlines()
-    start_position: tuple[int, int] = (0, 0)
-    obstacles: set[tuple[int, int]] = set()
+        lines: list[str] = file.read().splitlines()
+    start_position: XY | None = None
+    obstacles: list[XY] = []
     for y, line in enumerate(lines):
-        for x, char in enumerate(line[:-1]):
-            if char == ".":
-                continue
-            if char == "^":
-                start_position: tuple[int, int] = (x, y)
-                continue
-            if char == "#":
-                obstacles.add((x, y))
-                continue
-            raise ValueError(f"Unknown char {char} at ({x}, {y})")
-    if start_position == (0, 0):
+        unknown: re.Match[str] | None = UNKNOWN.search(line)
+        if unknown is not None:
+            x: int = unknown.start()
+            raise ValueError(f"Unknown char {unknown[0]} at ({x}, {y})")
+        for match in OBSTACLE.finditer(line):
+            obstacles.append((match.start(), y))
+        if (x := line.find("^")) != -1:
+            start_position = (x, y)
+    if start_position is None:
         raise ValueError("Start position not found")
     return Patrol(
         start_x=start_position[0],
         start_y=start_position[1],
-        max_x=len(lines[0][:-1]) - 1,
-        max_y=len(lines) - 1,
+        width=len(lines[0]),
+        height=len(lines),
         obstacles=obstacles,
     )
 
 
-def is_looping_patrol(patrol: Patrol, new_obstacle: tuple[int, int]) -> bool:
-    if new_obstacle in patrol.obstacles:
-        return False
-    logging.debug(f"Checking {new_obstacle}")
-    patrol.obstacles.add(new_obstacle)
-    is_looping: bool = False
-    while patrol.is_in_bounds and not is_looping:
-        is_looping: bool = patrol.move()
-    patrol.obstacles.discard(new_obstacle)
-    patrol.reset()
-    return is_looping
+def count_loops(patrol: Patrol, candidates: list[tuple[XY, State]]) -> int:
+    """
+    An obstruction only changes the route from where the guard would first
+    walk into it, so each trial starts from the state just before that
+    """
+    counter: int = 0
+    for (x, y), state in candidates:
+        logging.debug("Checking %s", (x, y))
+        patrol.add_obstacle(x, y)
+        counter += int(patrol.is_looping(state))
+        patrol.remove_obstacle(x, y)
+    return counter
 
 
-def main(input_path: str) -> int:
+def main(input_path: str, workers: int = 1) -> int:
     patrol: Patrol = read_input(input_path)
-    counter: int = 0
-    for x in range(patrol.max_x + 1):
-        for y in range(patrol.max_y + 1):
-            counter += int(is_looping_patrol(patrol, (x, y)))
-    return counter
+    candidates: list[tuple[XY, State]] = list(patrol.route().items())
+    if workers <= 1:
+        return count_loops(patrol, candidates)
+    chunks: list[list[tuple[XY, State]]] = [
+        candidates[n :: workers * 4] for n in range(workers * 4)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(count_loops, repeat(patrol), chunks))
 
 
 if __name__ == "__main__":
     parser: ArgumentParser = ArgumentParser()
     parser.add_argument(dest="path", nargs=1)
     parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count() or 1,
+        default=1,
+        dest="workers",
+        help="Try obstructions in a process pool. Without a value every core",
+    )
     args: Namespace = parser.parse_args()
     if args.verbose:
         logging.basicConfig(level=logging.DEBUG)
-    patrols: int = main(args.path[0])
+    patrols: int = main(args.path[0], args.workers)
     print(f"There are {patrols} possible looping patrols")
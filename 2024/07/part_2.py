@@ -1,63 +1,152 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser, Namespace
-from collections.abc import Callable, Iterator
-from itertools import product
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from time import perf_counter
 import logging
+import os
 
 type EquationsType = list[tuple[int, list[int]]]
+type Undo = Callable[[int, int], int | None]
+type ChunkResult = tuple[int, int, int, float]
 
-POSSIBLE_OPERATORS: list[str] = ["+", "*", "||"]
+CHUNK_LINES: int = 10_000
+
+# Returned by an inverse when any earlier result works, as for 0 = x * 0
+ANY: int = -1
+
+# Numbers are never negative, so each inverse fails when the target is too
+# small. Zero operands are allowed.
+OPERATORS: dict[str, Undo] = {
+    "+": lambda target, operand: (
+        target - operand if target >= operand else None
+    ),
+    "*": lambda target, operand: _undivide(target, operand),
+    "||": lambda target, operand: _unconcatenate(target, operand),
+}
+
+
+def parse_equation(line: str) -> tuple[int, list[int]]:
+    target, _, parts = line.partition(":")
+    operands: list[int] = [int(value) for value in parts.split()]
+    if int(target) < 0 or min(operands, default=0) < 0:
+        raise ValueError(f"Negative number in {line.strip()!r}")
+    return int(target), operands
 
 
 def read_input(filepath: str) -> EquationsType:
     with open(filepath, "r") as file:
-        lines: list[str] = file.read().splitlines()
-    equations: EquationsType = [
-        (
-            int(line[: line.find(":")]),
-            [int(value) for value in line[line.find(":") + 2 :].split(" ")],
-        )
-        for line in lines
-    ]
-    return equations
-
-
-def operator_combinations(n_parts: int) -> Iterator[list[str]]:
-    for combination in product(POSSIBLE_OPERATORS, repeat=n_parts - 1):
-        yield list(combination)
-
-
-def _calculate_equation(parts: list[int], combination: list[str]) -> int:
-    product: int = parts[0]
-    equation: list[str] = [str(parts[0])]
-    for n in range(1, len(parts)):
-        operator: str = combination[n - 1]
-        if operator == "*":
-            equation.append("*")
-            product *= parts[n]
-        if operator == "+":
-            equation.append("+")
-            product += parts[n]
-        if operator == "||":
-            equation.append("||")
-            product: int = int(str(product) + str(parts[n]))
-        equation.append(str(parts[n]))
-    logging.debug(f"{''.join(equation)} = {product}")
-    return product
-
-
-def calculate_equation(target: int, parts: list[int]) -> int:
-    log_result: Callable = lambda x: logging.debug(f"{x} {target} from {parts}")
-    for combination in operator_combinations(len(parts)):
-        product: int = _calculate_equation(parts, combination)
-        if product == target:
-            log_result("+")
-            return target
-    log_result("-")
+        return [parse_equation(line) for line in file]
+
+
+def _undivide(target: int, operand: int) -> int | None:
+    """The target divided by operand, if operand divides it"""
+    if operand == 0:
+        return ANY if target == 0 else None
+    if target % operand == 0:
+        return target // operand
+    return None
+
+
+def _unconcatenate(target: int, operand: int) -> int | None:
+    """The target without operand's digits on the end, if it ends in them"""
+    place: int = 10
+    while place <= operand:
+        place *= 10
+    if target >= operand and target % place == operand:
+        return target // place
+    return None
+
+
+def _is_solvable(
+    target: int,
+    parts: list[int],
+    n: int,
+    undos: list[Undo],
+) -> bool:
+    """If parts up to n can make target, undoing the last operator first"""
+    if n == 0:
+        return target == parts[0]
+    for undo in undos:
+        previous: int | None = undo(target, parts[n])
+        if previous == ANY:
+            return True
+        if previous is not None and _is_solvable(previous, parts, n - 1, undos):
+            return True
+    return False
+
+
+def calculate_equation(
+    target: int,
+    parts: list[int],
+    operators: dict[str, Undo] = OPERATORS,
+) -> int:
+    """
+    Works right to left from the target. Each operator is given by its inverse,
+    which returns None when the last operand cannot have produced the target,
+    so whole branches are pruned without evaluating them.
+    """
+    if _is_solvable(target, parts, len(parts) - 1, list(operators.values())):
+        logging.debug("+ %s from %s", target, parts)
+        return target
+    logging.debug("- %s from %s", target, parts)
     return 0
 
 
-def main(input_path: str) -> int:
+def solve_chunk(lines: list[str]) -> ChunkResult:
+    """The chunk's total, the worker's pid, the equation count and time taken"""
+    start: float = perf_counter()
+    total: int = 0
+    for line in lines:
+        total += calculate_equation(*parse_equation(line))
+    return total, os.getpid(), len(lines), perf_counter() - start
+
+
+def solve_parallel(filepath: str, workers: int, chunk_lines: int) -> int:
+    """
+    Streams chunks of lines to a process pool, keeping only a couple of chunks
+    per worker in flight so memory stays flat however long the file is.
+    Totals are summed in submission order and the throughput of each worker
+    is logged at the end.
+    """
+    total: int = 0
+    stats: dict[int, list[float]] = {}
+    pending: deque[Future[ChunkResult]] = deque()
+
+    def collect() -> int:
+        chunk_total, pid, equations, seconds = pending.popleft().result()
+        worker: list[float] = stats.setdefault(pid, [0, 0.0])
+        worker[0] += equations
+        worker[1] += seconds
+        return chunk_total
+
+    with open(filepath, "r") as file, ProcessPoolExecutor(workers) as executor:
+        for chunk in iter(lambda: list(islice(file, chunk_lines)), []):
+            pending.append(executor.submit(solve_chunk, chunk))
+            if len(pending) > workers * 2:
+                total += collect()
+        while pending:
+            total += collect()
+    for pid, (equations, seconds) in sorted(stats.items()):
+        logging.info(
+            "Worker %s solved %d equations in %.3f s, %.0f per second",
+            pid,
+            equations,
+            seconds,
+            equations / seconds if seconds else 0,
+        )
+    return total
+
+
+def main(
+    input_path: str,
+    workers: int = 1,
+    chunk_lines: int = CHUNK_LINES,
+) -> int:
+    if workers > 1:
+        return solve_parallel(input_path, workers, chunk_lines)
     equations: EquationsType = read_input(input_path)
     total: int = 0
     for equation in equations:
@@ -69,8 +158,27 @@ if __name__ == "__main__":
     parser: ArgumentParser = ArgumentParser()
     parser.add_argument(dest="path", nargs=1)
     parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count() or 1,
+        default=1,
+        dest="workers",
+        help="Solve in a process pool. Without a value uses every core",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunk-lines",
+        type=int,
+        default=CHUNK_LINES,
+        help="Equations sent to a worker at a time",
+    )
     args: Namespace = parser.parse_args()
     if args.verbose:
         logging.basicConfig(level=logging.DEBUG)
-    result: int = main(args.path[0])
+    elif args.workers > 1:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+    result: int = main(args.path[0], args.workers, args.chunk_lines)
     print(f"The calibration result is {result}")
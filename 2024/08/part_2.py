@@ -1,95 +1,190 @@
 #!/usr/bin/env python3
 from argparse import ArgumentParser, Namespace
+from array import array
 from collections import defaultdict
-from itertools import combinations
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, repeat
+from math import gcd
 import logging
+import os
+import re
+import sys
 
 type Position = tuple[int, int]
-type Antennas = dict[str, set[Position]]
+type Antennas = dict[str, list[Position]]
+
+ANTENNA: re.Pattern[str] = re.compile(r"[^.]")
+
+
+class Bitmap:
+    """One bit per grid cell, row by row"""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.bits: bytearray = bytearray((width * height + 7) // 8)
+
+    def __ior__(self, other: "Bitmap") -> "Bitmap":
+        merged: int = int.from_bytes(self.bits, "little")
+        merged |= int.from_bytes(other.bits, "little")
+        self.bits = bytearray(merged.to_bytes(len(self.bits), "little"))
+        return self
+
+    def mark(self, index: int) -> None:
+        self.bits[index >> 3] |= 1 << (index & 7)
+
+    def count(self) -> int:
+        return int.from_bytes(self.bits, "little").bit_count()
 
 
 def read_input(filepath: str) -> tuple[int, int, Antennas]:
     with open(filepath, "r") as file:
         lines: list[str] = file.read().splitlines()
-    output: defaultdict = defaultdict(set)
-    max_x: int = len(lines[0])
-    max_y: int = len(lines)
-    for y in range(max_y):
-        for x in range(max_x):
-            char: str = lines[y][x]
-            if char == ".":
-                continue
-            output[char].add((x, y))
-    return max_x, max_y, dict(output)
-
-
-def is_out_of_bounds(position: Position, max_x: int, max_y: int) -> bool:
-    if position[0] < 0 or position[0] >= max_x:
-        return True
-    if position[1] < 0 or position[1] >= max_y:
-        return True
-    return False
-
-
-def _find_antinodes(
-    antenna_1: Position,
-    antenna_2: Position,
-    max_x: int,
-    max_y: int,
-) -> set[Position]:
-    diff_x: int = antenna_1[0] - antenna_2[0]
-    diff_y: int = antenna_1[1] - antenna_2[1]
-    antinodes: set[Position] = set()
-    current_position: Position = antenna_1
-    while not is_out_of_bounds(current_position, max_x, max_y):
-        logging.debug(f"Antinode: {current_position}")
-        antinodes.add(current_position)
-        current_position = (
-            current_position[0] + diff_x,
-            current_position[1] + diff_y,
-        )
-    logging.debug(f"Switching direction")
-    current_position: Position = antenna_1
-    while not is_out_of_bounds(current_position, max_x, max_y):
-        logging.debug(f"Antinode: {current_position}")
-        antinodes.add(current_position)
-        current_position = (
-            current_position[0] - diff_x,
-            current_position[1] - diff_y,
-        )
-    return antinodes
+    output: defaultdict = defaultdict(list)
+    for y, line in enumerate(lines):
+        for match in ANTENNA.finditer(line):
+            output[match[0]].append((match.start(), y))
+    return len(lines[0]), len(lines), dict(output)
+
+
+def _steps(start: int, step: int, size: int) -> range:
+    """The multiples k of step that keep start + k * step in [0, size)"""
+    if step > 0:
+        return range(-(start // step), (size - 1 - start) // step + 1)
+    if step < 0:
+        return range(-((size - 1 - start) // -step), start // -step + 1)
+    # Any k keeps a fixed coordinate on the grid, the other axis bounds it
+    return range(-sys.maxsize, sys.maxsize)
 
 
-def find_antinodes(
-    antennas: set[Position],
-    max_x: int,
-    max_y: int,
-) -> set[Position]:
-    antinodes: set[Position] = set()
-    for combination in combinations(antennas, 2):
-        logging.debug(f"Combination: {combination}")
-        antinodes.update(_find_antinodes(*combination, max_x, max_y))
+def pair_antinodes(
+    a: Position,
+    b: Position,
+    width: int,
+    height: int,
+) -> Iterator[int]:
+    """
+    Every cell in line with the pair, as flat indices. Stepping by the delta
+    divided by its gcd reaches every such cell, and the range of steps that
+    stays on the grid is worked out up front rather than tested per cell.
+    """
+    divisor: int = gcd(b[0] - a[0], b[1] - a[1])
+    step_x: int = (b[0] - a[0]) // divisor
+    step_y: int = (b[1] - a[1]) // divisor
+    xs: range = _steps(a[0], step_x, width)
+    ys: range = _steps(a[1], step_y, height)
+    start: int = a[1] * width + a[0]
+    step: int = step_y * width + step_x
+    for k in range(max(xs.start, ys.start), min(xs.stop, ys.stop)):
+        yield start + k * step
+
+
+def mark_antinodes(antinodes: Bitmap, positions: list[Position]) -> None:
+    for a, b in combinations(positions, 2):
+        logging.debug("Combination: %s", (a, b))
+        for index in pair_antinodes(a, b, antinodes.width, antinodes.height):
+            antinodes.mark(index)
+
+
+class LiveAntinodes:
+    """
+    A map whose antennas can be added and removed between queries. Each cell
+    keeps a count of the antenna pairs with an antinode there, so changing an
+    antenna only visits its pairs with antennas of the same frequency, and
+    `count` of cells with any antinode is always up to date.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.antennas: defaultdict[str, set[Position]] = defaultdict(set)
+        self.references: array = array("L", [0]) * (width * height)
+        self.count: int = 0
+
+    @classmethod
+    def from_input(cls, filepath: str) -> "LiveAntinodes":
+        width, height, antennas = read_input(filepath)
+        live: LiveAntinodes = cls(width, height)
+        for frequency, positions in antennas.items():
+            for position in positions:
+                live.add(frequency, position)
+        return live
+
+    def _antinodes(self, frequency: str, position: Position) -> Iterator[int]:
+        for other in self.antennas[frequency]:
+            yield from pair_antinodes(position, other, self.width, self.height)
+
+    def add(self, frequency: str, position: Position) -> None:
+        x, y = position
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError(f"{position} is off the map")
+        if position in self.antennas[frequency]:
+            return
+        for index in self._antinodes(frequency, position):
+            if not self.references[index]:
+                self.count += 1
+            self.references[index] += 1
+        self.antennas[frequency].add(position)
+
+    def remove(self, frequency: str, position: Position) -> None:
+        self.antennas[frequency].remove(position)
+        for index in self._antinodes(frequency, position):
+            self.references[index] -= 1
+            if not self.references[index]:
+                self.count -= 1
+
+
+def frequency_antinodes(
+    positions: list[Position],
+    width: int,
+    height: int,
+) -> Bitmap:
+    antinodes: Bitmap = Bitmap(width, height)
+    mark_antinodes(antinodes, positions)
     return antinodes
 
 
-def main(input_path: str) -> int:
-    all_input: tuple[int, int, Antennas] = read_input(input_path)
-    antinodes: set[Position] = set()
-    for antennas in all_input[2].values():
-        if len(antennas) < 2:
-            continue
-        logging.debug(f"Positions: {antennas}")
-        antinodes.update(find_antinodes(antennas, all_input[0], all_input[1]))
-    logging.debug(f"Antinodes: {antinodes}")
-    return len(antinodes)
+def main(input_path: str, workers: int = 1) -> int:
+    """
+    With workers, each frequency is marked on its own bitmap in a process
+    pool and the bitmaps are ORed together
+    """
+    width, height, antennas = read_input(input_path)
+    antinodes: Bitmap = Bitmap(width, height)
+    if workers <= 1:
+        for positions in antennas.values():
+            logging.debug("Positions: %s", positions)
+            mark_antinodes(antinodes, positions)
+        return antinodes.count()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        bitmaps: Iterator[Bitmap] = executor.map(
+            frequency_antinodes,
+            antennas.values(),
+            repeat(width),
+            repeat(height),
+        )
+        for bitmap in bitmaps:
+            antinodes |= bitmap
+    return antinodes.count()
 
 
 if __name__ == "__main__":
     parser: ArgumentParser = ArgumentParser()
     parser.add_argument(dest="path", nargs=1)
     parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count() or 1,
+        default=1,
+        dest="workers",
+        help="Mark frequencies in a process pool. Without a value every core",
+    )
     args: Namespace = parser.parse_args()
     if args.verbose:
         logging.basicConfig(level=logging.DEBUG)
-    safe: int = main(args.path[0])
-    print(f"The number of safe reports is: {safe}")
+    antinodes: int = main(args.path[0], args.workers)
+    print(f"The number of antinodes is: {antinodes}")
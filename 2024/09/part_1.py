@@ -7,7 +7,7 @@ import logging
 def read_input(filepath: str) -> list[str]:
     with open(filepath, "r") as file:
         output: list[str] = list(file.read()[:-1])
-    logging.debug(f"Disk map: {output}")
+    logging.debug("Disk map: %s", output)
     return output
 
 
@@ -23,7 +23,7 @@ def _blocks(disk_map: list[str]) -> list[str]:
         else:
             block: str = "."
         blocks.extend(repeat(block, int(file_size)))
-    logging.debug(f"Blocks: {blocks}")
+    logging.debug("Blocks: %s", blocks)
     return blocks
 
 
@@ -33,7 +33,7 @@ def compact(disk_map: list[str]) -> list[int]:
     output: list[int] = []
     total_blocks: int = len(rev_blocks)
     for block in blocks:
-        logging.debug(output)
+        logging.debug("Output: %s", output)
         if len(output) == total_blocks:
             break
         if block != ".":
@@ -41,7 +41,8 @@ def compact(disk_map: list[str]) -> list[int]:
             continue
         output.append(int(rev_blocks[0]))
         rev_blocks.pop(0)
-    logging.debug(f"Compacted: {''.join(map(str, output))}")
+    if logging.root.isEnabledFor(logging.DEBUG):
+        logging.debug("Compacted: %s", "".join(map(str, output)))
     return output
 
 
@@ -9,7 +9,7 @@ type Blocks = list[tuple[str, int]]
 def read_input(filepath: str) -> list[str]:
     with open(filepath, "r") as file:
         output: list[str] = list(file.read()[:-1])
-    logging.debug(f"Disk map: {output}")
+    logging.debug("Disk map: %s", output)
     return output
 
 
@@ -28,7 +28,7 @@ def _blocks(disk_map: list[str]) -> Blocks:
         else:
             block: str = "."
         blocks.append((block, int(file_size)))
-    logging.debug(f"Blocks: {blocks}")
+    logging.debug("Blocks: %s", blocks)
     return blocks
 
 
@@ -36,7 +36,7 @@ def _compact(disk_map: list[str]) -> Blocks:
     blocks: Blocks = _blocks(disk_map)
     rev_blocks: Blocks = blocks[::-1]
     for rev_char, rev_size in rev_blocks:
-        logging.debug("".join([char * size for char, size in blocks]))
+        logging.debug("Blocks: %s", blocks)
         for n, block in enumerate(blocks):
             char, size = block
             if char == rev_char:
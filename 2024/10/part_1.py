@@ -48,7 +48,7 @@ def _trails(
         if new_height != cur_height + 1:
             continue
         if new_height == 9:
-            logging.debug(f"Found a trail at {new_x}, {new_y}")
+            logging.debug("Found a trail at %s, %s", new_x, new_y)
             yield new_position
         for trail in _trails(topographic_map, (new_x, new_y), width, height):
             yield trail
@@ -59,16 +59,16 @@ def trails(topographic_map: TopographicMap) -> int:
     height: int = len(topographic_map)
     trails: set[str] = set()
     for y in range(height):
-        logging.debug(f"Starting Row {topographic_map[y]}")
+        logging.debug("Starting Row %s", topographic_map[y])
         for x in range(width):
             cur_height: int = topographic_map[y][x]
             if cur_height != 0:
                 continue
             start_position: Position = (x, y)
-            logging.debug(f"Checking start position at {start_position}")
+            logging.debug("Checking start position at %s", start_position)
             for trail in _trails(topographic_map, (x, y), width, height):
                 trails.add(f"{start_position}:{trail}")
-    logging.debug(f"Found trails: {trails}")
+    logging.debug("Found trails: %s", trails)
     return len(trails)
 
 
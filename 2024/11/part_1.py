@@ -10,16 +10,16 @@ def read_input(filepath: str) -> list[int]:
 
 def _blink(stone: int) -> list[int]:
     if stone == 0:
-        logging.debug("{stone} = 0. Returning 1")
+        logging.debug("%s = 0. Returning 1", stone)
         return [1]
     length: int = len(str(stone))
     if length % 2 == 0:
         left: int = int(str(stone)[: length // 2])
         right: int = int(str(stone)[length // 2 :])
-        logging.debug(f"{stone} even length. Returning {left} and {right}")
+        logging.debug("%s even length. Returning %s and %s", stone, left, right)
         return [left, right]
     new: int = stone * 2024
-    logging.debug(f"{stone} meets no rules. Returning {new}")
+    logging.debug("%s meets no rules. Returning %s", stone, new)
     return [new]
 
 
@@ -34,7 +34,7 @@ def blink(stones: list[int]) -> list[int]:
 def main(input_path: str, blinks: int) -> int:
     stones: list[int] = read_input(input_path)
     for n in range(blinks):
-        logging.debug(f"Blink {n}: {stones}")
+        logging.debug("Blink %s: %s", n, stones)
         stones: list[int] = blink(stones)
     return len(stones)
 
@@ -29,7 +29,7 @@ def main(input_path: str, blinks: int) -> int:
     stones: list[int] = read_input(input_path)
     output: int = 0
     for n, stone in enumerate(stones):
-        logging.debug(f"Starting stone {n} value {stone}")
+        logging.debug("Starting stone %s value %s", n, stone)
         output += blink(stone, blinks)
     return output
 
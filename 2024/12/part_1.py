@@ -38,7 +38,7 @@ def regions(plot_map: PlotMap) -> Iterator[Region]:
             continue
         plant: str = plot_map[plot]
         region: Region = set(_region(plot_map, plot))
-        logging.debug(f"Plant {plant} Region {region}")
+        logging.debug("Plant %s Region %s", plant, region)
         yield region
 
 
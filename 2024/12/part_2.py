@@ -52,7 +52,7 @@ def regions(plot_map: PlotMap) -> Iterator[Region]:
             continue
         plant: str = plot_map[plot]
         region: Region = set(_region(plot_map, plot))
-        logging.debug(f"Plant {plant} Region {region}")
+        logging.debug("Plant %s Region %s", plant, region)
         yield region
 
 
@@ -62,7 +62,7 @@ def sides(region: Region) -> int:
         dirs: list[bool] = [not n(*plot) not in region for n in DIRECTIONS]
         for corner in CORNERS:
             output += int(corner(dirs))
-    logging.debug(f"Sides {output}")
+    logging.debug("Sides %s", output)
     return output
 
 
@@ -42,11 +42,11 @@ def tokens_to_prize(p: Position, a: Position, b: Position) -> int:
     """
     times_b: float = (p[1] * a[0] - p[0] * a[1]) / (b[1] * a[0] - b[0] * a[1])
     if times_b < 0 or times_b > MAX_PRESSES or not times_b.is_integer():
-        logging.debug(f"Invalid times_b: {times_b}")
+        logging.debug("Invalid times_b: %s", times_b)
         return 0
     times_a: float = (p[0] - b[0] * times_b) / a[0]
     if times_a < 0 or times_a > MAX_PRESSES or not times_a.is_integer():
-        logging.debug(f"Invalid times_a: {times_a}")
+        logging.debug("Invalid times_a: %s", times_a)
         return 0
     return int(times_a) * A_COST + int(times_b) * B_COST
 
@@ -54,7 +54,7 @@ def tokens_to_prize(p: Position, a: Position, b: Position) -> int:
 def main(input_path: str) -> int:
     output: int = 0
     for machine in read_input(input_path):
-        logging.debug(f"Machine: {machine}")
+        logging.debug("Machine: %s", machine)
         output += tokens_to_prize(machine[2], machine[0], machine[1])
     return output
 
@@ -31,10 +31,12 @@ def _position(position: XY, velocity: XY, seconds: int) -> XY:
 
 
 def positions(robots: list[tuple[XY, XY]], seconds: int) -> Iterator[XY]:
-    logging.debug(f"Seconds: {seconds}")
+    logging.debug("Seconds: %s", seconds)
     for n, robot in enumerate(robots):
         end_position: XY = _position(robot[0], robot[1], seconds)
-        logging.debug(f"Robot {n}: {robot[0]} -> {end_position}. V: {robot[1]}")
+        logging.debug(
+            "Robot %s: %s -> %s. V: %s", n, robot[0], end_position, robot[1]
+        )
         yield end_position
 
 
@@ -61,11 +63,11 @@ def main(input_path: str, seconds: int) -> int:
     quadrants: list[int] = [0, 0, 0, 0]
     for position in positions(robots, seconds):
         quadrant: int = _quadrant(position[0], position[1])
-        logging.debug(f"Position: {position}, Quadrant: {quadrant}")
+        logging.debug("Position: %s, Quadrant: %s", position, quadrant)
         if quadrant == 4:
             continue
         quadrants[quadrant] += 1
-    logging.debug(f"Quadrants: {quadrants}")
+    logging.debug("Quadrants: %s", quadrants)
     return prod(quadrants)
 
 
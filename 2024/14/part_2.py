@@ -30,7 +30,7 @@ def _position(position: XY, velocity: XY, seconds: int) -> XY:
 
 
 def _positions(robots: list[tuple[XY, XY]], seconds: int) -> Iterator[XY]:
-    logging.debug(f"Seconds: {seconds}")
+    logging.debug("Seconds: %s", seconds)
     for robot in robots:
         end_position: XY = _position(robot[0], robot[1], seconds)
         yield end_position
@@ -42,7 +42,7 @@ def main(input_path: str) -> int:
     while True:
         positions: list[XY] = list(_positions(robots, seconds))
         if len(positions) == len(set(positions)):
-            logging.debug(f"Positions: {positions}")
+            logging.debug("Positions: %s", positions)
             break
         seconds += 1
     return seconds
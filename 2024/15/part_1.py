@@ -64,30 +64,32 @@ class Warehouse:
 
     def move_box(self, box: XY, move_func: Callable[[XY], XY]) -> bool:
         new_position: XY = move_func(box)
-        logging.debug(f"Moving box {box} to {new_position}")
+        logging.debug("Moving box %s to %s", box, new_position)
         if new_position in self.walls:
-            logging.debug(f"Aborting move to wall {new_position}")
+            logging.debug("Aborting move to wall %s", new_position)
             return False
         if new_position in self.boxes:
             if not self.move_box(new_position, move_func):
                 return False
         self.boxes.remove(box)
         self.boxes.add(new_position)
-        logging.debug(f"Moved box {box} to {new_position}")
+        logging.debug("Moved box %s to %s", box, new_position)
         return True
 
     def move_robot(self, direction: str) -> None:
-        logging.debug(f"Moving robot {self.robot_position} {direction}")
+        logging.debug("Moving robot %s %s", self.robot_position, direction)
         move_func: Callable[[XY], XY] = Warehouse.MOVES[direction]
         new_position: XY = move_func(self._robot_position)
         if new_position in self.walls:
-            logging.debug(f"Aborting move to wall {new_position}")
+            logging.debug("Aborting move to wall %s", new_position)
             return
         if new_position in self.boxes:
             if not self.move_box(new_position, move_func):
-                logging.debug(f"Aborting move to box {new_position}")
+                logging.debug("Aborting move to box %s", new_position)
                 return
-        logging.debug(f"Moved robot {self._robot_position} to {new_position}")
+        logging.debug(
+            "Moved robot %s to %s", self._robot_position, new_position
+        )
         self._robot_position = new_position
 
     def make_moves(self, moves: list[str]) -> None:
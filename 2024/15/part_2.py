@@ -87,7 +87,7 @@ class Warehouse:
                     self._robot_position = (x, y)
 
     def can_box_move(self, box: XY, direction: str) -> bool:
-        logging.debug(f"Can box {box} move {direction}")
+        logging.debug("Can box %s move %s", box, direction)
         move_func: Callable[[XY], XY] = Warehouse.MOVES[direction]
         new_l: XY = move_func(box)
         new_r: XY = (new_l[0] + 1, new_l[1])
@@ -122,14 +122,14 @@ class Warehouse:
             self.move_box(next_box, direction)
         self.boxes.remove(box)
         self.boxes.add(new)
-        logging.debug(f"Moved box {box} to {new}")
+        logging.debug("Moved box %s to %s", box, new)
 
     def move_robot(self, direction: str) -> None:
-        logging.debug(f"Moving robot {self.robot_position} {direction}")
+        logging.debug("Moving robot %s %s", self.robot_position, direction)
         move_func: Callable[[XY], XY] = Warehouse.MOVES[direction]
         new_position: XY = move_func(self._robot_position)
         if new_position in self.walls:
-            logging.debug(f"Aborting move to wall {new_position}")
+            logging.debug("Aborting move to wall %s", new_position)
             return
         box_positions: set[XY] = set()
         if direction == "<":
@@ -142,15 +142,17 @@ class Warehouse:
             if not self.can_box_move(list(box_position)[0], direction):
                 return
             self.move_box(list(box_position)[0], direction)
-        logging.debug(f"Moved robot {self._robot_position} to {new_position}")
+        logging.debug(
+            "Moved robot %s to %s", self._robot_position, new_position
+        )
         self._robot_position = new_position
 
     def make_moves(self, moves: list[str]) -> None:
-        print(self)
+        logging.debug("Start:\n%s", self)
         for n, move in enumerate(moves):
-            logging.debug(f"Move: {n}, {move}")
+            logging.debug("Move: %s, %s", n, move)
             self.move_robot(move)
-        print(self)
+        logging.debug("End:\n%s", self)
 
     @staticmethod
     def box_coordinate(box: XY) -> int:
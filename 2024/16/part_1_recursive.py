@@ -50,7 +50,7 @@ def route_scores(
 ) -> Iterator[int]:
     if position == end:
         score: int = steps + (turns * 1000)
-        logging.debug(f"Steps {steps:3d}. Turns {turns:3d}. Score {score}")
+        logging.debug("Steps %3d. Turns %3d. Score %s", steps, turns, score)
         yield score
     n_directions: int = len(DIRECTIONS)
     for n in range(direction, direction + 4):
@@ -80,7 +80,7 @@ def main(input_path: str) -> int:
     width: int = maze.find("\n")
     start: XY = char_position(maze.replace("\n", "").find(START_CHAR), width)
     end: XY = char_position(maze.replace("\n", "").find(END_CHAR), width)
-    logging.debug(f"Start {start}. End {end}")
+    logging.debug("Start %s. End %s", start, end)
     spaces: set[XY] = maze_spaces(maze)
     return min(list(route_scores(start, end, spaces)))
 
@@ -0,0 +1,5 @@
+"""
+Tooling for running, timing and generating inputs for the solutions.
+
+Run `python -m aoc --help` from the repository root for usage.
+"""
@@ -0,0 +1,23 @@
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from types import ModuleType
+
+from aoc import batch, bench, generate, profiling, runner
+
+COMMANDS: dict[str, ModuleType] = {
+    "run": runner,
+    "batch": batch,
+    "bench": bench,
+    "generate": generate,
+    "profile": profiling,
+}
+
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser(prog="python -m aoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, module in COMMANDS.items():
+        module.add_arguments(subparsers.add_parser(name))
+    args: Namespace = parser.parse_args()
+    command: Callable[[Namespace], int] = COMMANDS[args.command].main
+    raise SystemExit(command(args))
@@ -0,0 +1,54 @@
+"""
+Solves many inputs with one solution in a single process, streaming one JSON
+line per input as soon as it is solved.
+
+The solution is loaded once and its `main` called for every input, so module
+level state stays warm between files: compiled regexes, lookup tables and
+input independent `functools.cache` contents such as 2024/11's `blink`.
+"""
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from pathlib import Path
+import json
+
+from aoc.runner import Job, Result, timed
+from aoc.solutions import Solution, expand_inputs
+
+
+def solve(main: Callable[..., object], job: Job) -> Result:
+    try:
+        answer, seconds = timed(main, job)
+    except Exception as error:
+        return Result(job, error=f"{type(error).__name__}: {error}")
+    return Result(job, answer, seconds)
+
+
+def add_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument("solution", type=Path, help="e.g. 2024/11/part_2.py")
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Input files, directories or globs",
+    )
+    parser.add_argument(
+        "-a",
+        "--arg",
+        type=int,
+        nargs="+",
+        dest="extra_args",
+        default=[],
+        help="Extra positional arguments for main, e.g. blinks for 2024/11",
+    )
+
+
+def main(args: Namespace) -> int:
+    solution: Solution = Solution.from_path(args.solution)
+    solve_main: Callable[..., object] = solution.load().main
+    failures: int = 0
+    for input_path in expand_inputs(args.inputs):
+        job: Job = Job(solution, input_path, args.extra_args)
+        result: Result = solve(solve_main, job)
+        failures += int(result.error is not None)
+        print(json.dumps(result.to_dict(), default=str), flush=True)
+    return int(failures > 0)
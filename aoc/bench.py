@@ -0,0 +1,214 @@
+from argparse import ArgumentParser, Namespace
+from collections.abc import Iterator
+from math import ceil
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+import json
+import os
+import tracemalloc
+
+from aoc.cache import DISABLE_VARIABLE
+from aoc.generate import DEFAULT_SEED, GENERATORS, write_input
+from aoc.runner import Job, jobs, timed
+from aoc.solutions import add_selection_arguments, solutions
+
+type Baseline = dict[str, dict[str, float]]
+
+DEFAULT_REPEATS: int = 5
+DEFAULT_THRESHOLD: float = 0.1
+
+
+class Measurement:
+    def __init__(self, job: Job, samples: list[float], peak_bytes: int) -> None:
+        self.job: Job = job
+        self.samples: list[float] = sorted(samples)
+        self.peak_bytes: int = peak_bytes
+
+    def __str__(self) -> str:
+        return (
+            f"{self.job.solution.name:<24} "
+            f"{self.job.input_path.name:<24} "
+            f"{self.input_bytes:>12} B "
+            f"{self.min * 1000:10.3f} "
+            f"{self.median * 1000:10.3f} "
+            f"{self.p95 * 1000:10.3f} ms "
+            f"{self.peak_bytes / 1024:10.1f} KiB"
+        )
+
+    @property
+    def key(self) -> str:
+        return f"{self.job.solution.name}:{self.job.input_path.name}"
+
+    @property
+    def input_bytes(self) -> int:
+        return self.job.input_path.stat().st_size
+
+    @property
+    def min(self) -> float:
+        return self.samples[0]
+
+    @property
+    def median(self) -> float:
+        return median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        """Nearest rank percentile"""
+        return self.samples[ceil(0.95 * len(self.samples)) - 1]
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "input_bytes": self.input_bytes,
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "peak_bytes": self.peak_bytes,
+        }
+
+
+def peak_memory(job: Job) -> int:
+    """
+    Run separately from the timed repeats as tracemalloc slows allocation
+    heavy code down by several times.
+    """
+    module = job.solution.load()
+    tracemalloc.start()
+    try:
+        timed(module.main, job)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure(job: Job, repeats: int, memory: bool = True) -> Measurement:
+    samples: list[float] = []
+    for _ in range(repeats):
+        module = job.solution.load()
+        _, seconds = timed(module.main, job)
+        samples.append(seconds)
+    peak_bytes: int = peak_memory(job) if memory else 0
+    return Measurement(job, samples, peak_bytes)
+
+
+def generated_jobs(args: Namespace, directory: Path) -> Iterator[Job]:
+    """
+    One job per selected part and size. Inputs are generated once per day and
+    size and shared between the parts.
+    """
+    for solution in solutions(args.years, args.days, args.parts):
+        if (solution.year, solution.day) not in GENERATORS:
+            continue
+        for size in args.sizes:
+            path: Path = (
+                directory
+                / str(solution.year)
+                / f"{solution.day:02d}"
+                / f"size_{size}.txt"
+            )
+            if not path.exists():
+                write_input(path, solution.year, solution.day, size, args.seed)
+            yield Job(solution, path, args.extra_args)
+
+
+def load_baseline(path: Path) -> Baseline:
+    return json.loads(path.read_text())
+
+
+def save_baseline(path: Path, measurements: list[Measurement]) -> None:
+    baseline: Baseline = {m.key: m.to_dict() for m in measurements}
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def is_regression(
+    measurement: Measurement,
+    baseline: Baseline,
+    threshold: float,
+) -> bool:
+    previous: dict[str, float] | None = baseline.get(measurement.key)
+    if previous is None:
+        return False
+    return measurement.median > previous["median"] * (1 + threshold)
+
+
+def add_arguments(parser: ArgumentParser) -> None:
+    add_selection_arguments(parser)
+    parser.add_argument(
+        "-r",
+        "--repeats",
+        type=int,
+        default=DEFAULT_REPEATS,
+        help="Timed runs per part and input",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_false",
+        dest="memory",
+        help="Skip the tracemalloc peak memory run",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        help="Benchmark on generated inputs of these sizes instead of files",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help="Seed for generated inputs",
+    )
+    parser.add_argument("--save", type=Path, help="Write results as JSON")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Previously saved results to check for regressions",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed fractional slowdown of the median before flagging",
+    )
+
+
+def benchmark(args: Namespace, selected_jobs: Iterator[Job]) -> int:
+    baseline: Baseline = load_baseline(args.baseline) if args.baseline else {}
+    measurements: list[Measurement] = []
+    regressions: int = 0
+    failures: int = 0
+    print(
+        f"{'part':<24} {'input':<24} {'size':>14} "
+        f"{'min':>10} {'median':>10} {'p95':>10} {'':>2} {'peak':>14}"
+    )
+    for job in selected_jobs:
+        try:
+            measurement: Measurement = measure(job, args.repeats, args.memory)
+        except Exception as error:
+            name: str = f"{job.solution.name:<24} {job.input_path.name:<24}"
+            print(f"{name} error: {type(error).__name__}: {error}")
+            failures += 1
+            continue
+        measurements.append(measurement)
+        flag: str = ""
+        if is_regression(measurement, baseline, args.threshold):
+            regressions += 1
+            flag = " REGRESSION"
+        print(f"{measurement}{flag}")
+    if failures:
+        # A baseline missing the failed parts would pass them as new later
+        print(f"{failures} part(s) failed, no baseline saved")
+    elif args.save:
+        save_baseline(args.save, measurements)
+    if regressions:
+        print(f"{regressions} regression(s) beyond {args.threshold:.0%}")
+    return int(regressions > 0 or failures > 0)
+
+
+def main(args: Namespace) -> int:
+    os.environ[DISABLE_VARIABLE] = "1"
+    if not args.sizes:
+        return benchmark(args, jobs(args))
+    with TemporaryDirectory(prefix="aoc-bench-") as directory:
+        return benchmark(args, generated_jobs(args, Path(directory)))
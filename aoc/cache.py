@@ -0,0 +1,102 @@
+"""
+Content addressed answer cache.
+
+Answers are stored under a hash of the input bytes, the solver's source and any
+extra arguments, so editing either the input or the solution misses the cache.
+Each answer is one small JSON file; reads refresh its modification time and the
+oldest files are evicted once the directory grows past its size limit. The
+directory size is scanned once and then kept as a running total, so it is only
+walked again when the total goes over the limit.
+"""
+
+from collections.abc import Sequence
+from pathlib import Path
+import hashlib
+import json
+import os
+
+from aoc.solutions import ROOT
+
+DEFAULT_DIRECTORY: Path = ROOT / ".cache" / "answers"
+DEFAULT_MAX_BYTES: int = 16 * 1024 * 1024
+# Read by solutions with caches of their own, so pool workers inherit it
+DISABLE_VARIABLE: str = "AOC_NO_CACHE"
+
+
+def file_hash(path: Path) -> str:
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+class AnswerCache:
+    def __init__(
+        self,
+        directory: Path = DEFAULT_DIRECTORY,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.directory: Path = directory
+        self.max_bytes: int = max_bytes
+        self.total_bytes: int | None = None
+
+    @staticmethod
+    def key(source_path: Path, input_path: Path, args: Sequence[object]) -> str:
+        parts: list[str] = [
+            file_hash(source_path),
+            file_hash(input_path),
+            json.dumps(list(args)),
+        ]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> tuple[bool, object]:
+        path: Path = self._path(key)
+        try:
+            answer: object = json.loads(path.read_text())["answer"]
+        except (FileNotFoundError, ValueError, KeyError):
+            return False, None
+        os.utime(path)
+        return True, answer
+
+    def put(self, key: str, answer: object) -> None:
+        try:
+            content: str = json.dumps({"answer": answer})
+        except TypeError:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path: Path = self._path(key)
+        temporary: Path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            replaced: int = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        temporary.write_text(content)
+        temporary.replace(path)
+        if self.total_bytes is None:
+            self.total_bytes = sum(size for _, size, _ in self._entries())
+        else:
+            self.total_bytes += len(content.encode()) - replaced
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat: os.stat_result = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> None:
+        """Removes the least recently used answers until under max_bytes"""
+        entries: list[tuple[float, int, Path]] = self._entries()
+        total: int = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self.total_bytes = total
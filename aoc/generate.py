@@ -0,0 +1,442 @@
+"""
+Seeded generators for synthetic puzzle inputs of arbitrary size.
+
+Each generator takes a seeded `Random` and a size and returns the input text in
+the format the day's solutions parse. For grid puzzles the size is the side
+length of the grid, for everything else it is the number of records (lines,
+machines, ranges...) unless noted otherwise.
+"""
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from pathlib import Path
+from random import Random
+from string import ascii_letters, ascii_uppercase, digits
+import sys
+
+type Generator = Callable[[Random, int], str]
+
+DEFAULT_SEED: int = 2024
+
+
+def _grid(rows: list[list[str]] | list[str]) -> str:
+    return "".join(f"{''.join(row)}\n" for row in rows)
+
+
+def _2024_01(rng: Random, size: int) -> str:
+    highest: int = min(99999, 10000 + size * 2)
+    lines: list[str] = []
+    for _ in range(size):
+        left: int = rng.randint(10000, highest)
+        right: int = rng.randint(10000, highest)
+        lines.append(f"{left}   {right}")
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _report(rng: Random) -> list[int]:
+    length: int = rng.randint(5, 8)
+    direction: int = rng.choice((-1, 1))
+    level: int = rng.randint(20, 70)
+    report: list[int] = [level]
+    for _ in range(length - 1):
+        level += direction * rng.randint(1, 3)
+        report.append(level)
+    if rng.random() < 0.5:
+        report[rng.randrange(length)] += rng.randint(-4, 4)
+    return report
+
+
+def _2024_02(rng: Random, size: int) -> str:
+    reports: list[str] = [" ".join(map(str, _report(rng))) for _ in range(size)]
+    return "".join(f"{report}\n" for report in reports)
+
+
+CORRUPTION: list[str] = [
+    "mul(4*",
+    "mul(6,9!",
+    "?(12,34)",
+    "mul ( 2 , 4 )",
+    "mul[3,7]",
+    "don't",
+    "do(",
+    "select()",
+    "from()",
+    "what()",
+    "how()",
+    "#",
+    "%&",
+    "@^",
+    "]",
+    "+",
+]
+
+
+def _2024_03(rng: Random, size: int) -> str:
+    tokens: list[str] = []
+    for _ in range(size):
+        roll: float = rng.random()
+        if roll < 0.4:
+            tokens.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        elif roll < 0.45:
+            tokens.append("do()")
+        elif roll < 0.5:
+            tokens.append("don't()")
+        else:
+            tokens.append(rng.choice(CORRUPTION))
+    return "".join(tokens) + "\n"
+
+
+def _2024_04(rng: Random, size: int) -> str:
+    return _grid([rng.choices("XMAS", k=size) for _ in range(size)])
+
+
+def _2024_05(rng: Random, size: int) -> str:
+    """Rules are every pair from one hidden total order over the pages"""
+    pages: list[int] = rng.sample(range(10, 100), 49)
+    rules: list[str] = [
+        f"{pages[a]}|{pages[b]}"
+        for a in range(len(pages))
+        for b in range(a + 1, len(pages))
+    ]
+    rng.shuffle(rules)
+    updates: list[str] = []
+    for _ in range(size):
+        update: list[int] = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def _guard_exits(rows: list[list[str]], x: int, y: int) -> bool:
+    size: int = len(rows)
+    dx, dy = 0, -1
+    seen: set[tuple[int, int, int, int]] = set()
+    while True:
+        next_x: int = x + dx
+        next_y: int = y + dy
+        if not (0 <= next_x < size and 0 <= next_y < size):
+            return True
+        if rows[next_y][next_x] == "#":
+            if (x, y, dx, dy) in seen:
+                return False
+            seen.add((x, y, dx, dy))
+            dx, dy = -dy, dx
+            continue
+        x, y = next_x, next_y
+
+
+def _2024_06(rng: Random, size: int) -> str:
+    """Re-rolls obstacles until the guard walks off the map"""
+    start: int = size // 2
+    while True:
+        rows: list[list[str]] = [
+            ["#" if rng.random() < 0.02 else "." for _ in range(size)]
+            for _ in range(size)
+        ]
+        rows[start][start] = "^"
+        if _guard_exits(rows, start, start):
+            return _grid(rows)
+
+
+OPERATORS: list[Callable[[int, int], int]] = [
+    lambda a, b: a + b,
+    lambda a, b: a * b,
+    lambda a, b: int(f"{a}{b}"),
+]
+
+
+def _2024_07(rng: Random, size: int) -> str:
+    lines: list[str] = []
+    for _ in range(size):
+        n_parts: int = rng.randint(2, 9)
+        parts: list[int] = [rng.randint(1, 99) for _ in range(n_parts)]
+        target: int = parts[0]
+        for part in parts[1:]:
+            target = rng.choice(OPERATORS)(target, part)
+        if rng.random() < 0.3:
+            target += 1
+        lines.append(f"{target}: {' '.join(map(str, parts))}")
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _2024_08(rng: Random, size: int) -> str:
+    frequencies: str = digits + ascii_letters
+    rows: list[list[str]] = [["."] * size for _ in range(size)]
+    for _ in range(size * size // 50):
+        rows[rng.randrange(size)][rng.randrange(size)] = rng.choice(frequencies)
+    return _grid(rows)
+
+
+def _2024_09(rng: Random, size: int) -> str:
+    """Size is the length of the disk map, rounded up to be odd"""
+    disk_map: list[str] = []
+    for n in range(size | 1):
+        minimum: int = 1 if n % 2 == 0 else 0
+        disk_map.append(str(rng.randint(minimum, 9)))
+    return "".join(disk_map) + "\n"
+
+
+def _2024_10(rng: Random, size: int) -> str:
+    return _grid(
+        [
+            [str((x + y + rng.choice((0, 0, 0, 1))) % 10) for x in range(size)]
+            for y in range(size)
+        ]
+    )
+
+
+def _2024_11(rng: Random, size: int) -> str:
+    return " ".join(str(rng.randint(0, 9999)) for _ in range(size)) + "\n"
+
+
+def _2024_12(rng: Random, size: int) -> str:
+    rows: list[list[str]] = []
+    for y in range(size):
+        row: list[str] = []
+        for x in range(size):
+            roll: float = rng.random()
+            if x and roll < 0.4:
+                row.append(row[x - 1])
+            elif y and roll < 0.6:
+                row.append(rows[y - 1][x])
+            else:
+                row.append(rng.choice(ascii_uppercase))
+        rows.append(row)
+    return _grid(rows)
+
+
+def _2024_13(rng: Random, size: int) -> str:
+    machines: list[str] = []
+    while len(machines) < size:
+        a: tuple[int, int] = (rng.randint(10, 99), rng.randint(10, 99))
+        b: tuple[int, int] = (rng.randint(10, 99), rng.randint(10, 99))
+        if a[0] * b[1] == a[1] * b[0]:
+            continue
+        presses_a: int = rng.randint(0, 100)
+        presses_b: int = rng.randint(0, 100)
+        prize_x: int = a[0] * presses_a + b[0] * presses_b + rng.choice((0, 1))
+        prize_y: int = a[1] * presses_a + b[1] * presses_b
+        machines.append(
+            f"Button A: X+{a[0]}, Y+{a[1]}\n"
+            f"Button B: X+{b[0]}, Y+{b[1]}\n"
+            f"Prize: X={prize_x}, Y={prize_y}\n"
+        )
+    return "\n".join(machines)
+
+
+def _2024_14(rng: Random, size: int) -> str:
+    """
+    Robots are placed on distinct tiles at a hidden time and wound back so part
+    2 always terminates. Size is capped by the number of tiles.
+    """
+    width: int = 101
+    height: int = 103
+    if size > width * height:
+        raise ValueError(f"At most {width * height} robots fit on the floor")
+    seconds: int = rng.randint(1, width * height - 1)
+    lines: list[str] = []
+    for tile in rng.sample(range(width * height), size):
+        v_x: int = rng.randint(-99, 99)
+        v_y: int = rng.randint(-99, 99)
+        p_x: int = (tile % width - v_x * seconds) % width
+        p_y: int = (tile // width - v_y * seconds) % height
+        lines.append(f"p={p_x},{p_y} v={v_x},{v_y}")
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _2024_15(rng: Random, size: int) -> str:
+    rows: list[list[str]] = []
+    for y in range(size):
+        row: list[str] = []
+        for x in range(size):
+            if x in (0, size - 1) or y in (0, size - 1):
+                row.append("#")
+                continue
+            roll: float = rng.random()
+            row.append("#" if roll < 0.05 else "O" if roll < 0.25 else ".")
+        rows.append(row)
+    rows[size // 2][size // 2] = "@"
+    moves: str = "".join(rng.choices("^v<>", k=size * 10))
+    move_lines: list[str] = [
+        moves[n : n + 70] for n in range(0, len(moves), 70)
+    ]
+    return _grid(rows) + "\n" + "\n".join(move_lines) + "\n"
+
+
+def _2024_16(rng: Random, size: int) -> str:
+    """A corridor up the left and along the top guarantees a route to E"""
+    rows: list[list[str]] = []
+    for y in range(size):
+        row: list[str] = []
+        for x in range(size):
+            if x in (0, size - 1) or y in (0, size - 1):
+                row.append("#")
+            elif x == 1 or y == 1:
+                row.append(".")
+            else:
+                row.append("#" if rng.random() < 0.25 else ".")
+        rows.append(row)
+    rows[size - 2][1] = "S"
+    rows[1][size - 2] = "E"
+    return _grid(rows)
+
+
+def _2025_01(rng: Random, size: int) -> str:
+    lines: list[str] = [
+        f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size)
+    ]
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _2025_02(rng: Random, size: int) -> str:
+    """Narrow ranges anywhere up to 10^18, half of them around repeated ids"""
+    ranges: list[str] = []
+    for _ in range(size):
+        if rng.random() < 0.5:
+            half: int = rng.randint(1, 10**9 - 1)
+            start: int = max(1, int(f"{half}{half}") - rng.randint(0, 50))
+        else:
+            start: int = rng.randint(1, 10**18)
+        ranges.append(f"{start}-{start + rng.randint(0, 100)}")
+    return ",".join(ranges) + "\n"
+
+
+def _2025_03(rng: Random, size: int) -> str:
+    banks: list[str] = [
+        "".join(rng.choices("123456789", k=100)) for _ in range(size)
+    ]
+    return "".join(f"{bank}\n" for bank in banks)
+
+
+def _2025_04(rng: Random, size: int) -> str:
+    return _grid([rng.choices("@@@..", k=size) for _ in range(size)])
+
+
+def _2025_05(rng: Random, size: int) -> str:
+    ranges: list[str] = []
+    for _ in range(size):
+        start: int = rng.randint(1, 10**14)
+        ranges.append(f"{start}-{start + rng.randint(0, 10**12)}")
+    ingredients: list[str] = [str(rng.randint(1, 10**14)) for _ in range(size)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ingredients) + "\n"
+
+
+def _2025_06(rng: Random, size: int) -> str:
+    """
+    Each problem's numbers are longest first so every digit column read top to
+    bottom is contiguous, as the cephalopod reading in part 2 expects.
+    """
+    rows: list[list[str]] = [[] for _ in range(4)]
+    symbols: list[str] = []
+    for _ in range(size):
+        numbers: list[str] = [str(rng.randint(1, 9999)) for _ in rows]
+        numbers.sort(key=len, reverse=True)
+        width: int = len(numbers[0])
+        right_align: bool = rng.random() < 0.5
+        for row, number in zip(rows, numbers):
+            if right_align:
+                row.append(number.rjust(width))
+            else:
+                row.append(number.ljust(width))
+        symbol: str = rng.choice("+*")
+        symbols.append(symbol.ljust(width))
+    lines: list[str] = [" ".join(row) for row in rows] + [" ".join(symbols)]
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _2025_07(rng: Random, size: int) -> str:
+    """Size is the manifold height. Splitters never sit on the edges."""
+    width: int = size | 1
+    lines: list[str] = ["." * (width // 2) + "S" + "." * (width // 2)]
+    for y in range(1, size):
+        row: list[str] = ["."] * width
+        if y % 2 == 0:
+            for x in range(1, width - 1):
+                if rng.random() < 0.2:
+                    row[x] = "^"
+        lines.append("".join(row))
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _2025_08(rng: Random, size: int) -> str:
+    boxes: set[tuple[int, int, int]] = set()
+    while len(boxes) < size:
+        boxes.add(tuple(rng.randint(0, 99999) for _ in range(3)))
+    return "".join(f"{x},{y},{z}\n" for x, y, z in boxes)
+
+
+def _2025_09(rng: Random, size: int) -> str:
+    tiles: list[str] = [
+        f"{rng.randint(0, 99999)},{rng.randint(0, 99999)}" for _ in range(size)
+    ]
+    return "".join(f"{tile}\n" for tile in tiles)
+
+
+GENERATORS: dict[tuple[int, int], Generator] = {
+    (2024, 1): _2024_01,
+    (2024, 2): _2024_02,
+    (2024, 3): _2024_03,
+    (2024, 4): _2024_04,
+    (2024, 5): _2024_05,
+    (2024, 6): _2024_06,
+    (2024, 7): _2024_07,
+    (2024, 8): _2024_08,
+    (2024, 9): _2024_09,
+    (2024, 10): _2024_10,
+    (2024, 11): _2024_11,
+    (2024, 12): _2024_12,
+    (2024, 13): _2024_13,
+    (2024, 14): _2024_14,
+    (2024, 15): _2024_15,
+    (2024, 16): _2024_16,
+    (2025, 1): _2025_01,
+    (2025, 2): _2025_02,
+    (2025, 3): _2025_03,
+    (2025, 4): _2025_04,
+    (2025, 5): _2025_05,
+    (2025, 6): _2025_06,
+    (2025, 7): _2025_07,
+    (2025, 8): _2025_08,
+    (2025, 9): _2025_09,
+}
+
+
+def generate(year: int, day: int, size: int, seed: int = DEFAULT_SEED) -> str:
+    generator: Generator | None = GENERATORS.get((year, day))
+    if generator is None:
+        raise ValueError(f"No generator for {year} day {day}")
+    return generator(Random(f"{year}/{day}/{size}/{seed}"), size)
+
+
+def write_input(
+    path: Path,
+    year: int,
+    day: int,
+    size: int,
+    seed: int = DEFAULT_SEED,
+) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(generate(year, day, size, seed))
+    return path
+
+
+def add_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("size", type=int)
+    parser.add_argument("-s", "--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="File to write to. Defaults to stdout",
+    )
+
+
+def main(args: Namespace) -> int:
+    if args.output:
+        write_input(args.output, args.year, args.day, args.size, args.seed)
+        return 0
+    sys.stdout.write(generate(args.year, args.day, args.size, args.seed))
+    return 0
@@ -0,0 +1,129 @@
+"""
+Compact 2D map for grid puzzles.
+
+Cells are single bytes in one row-major `bytearray`. Every row is surrounded by
+`padding` cells of `OUTSIDE`, so stepping from any cell on the map by any
+neighbour offset (up to `padding` cells away) lands on a valid index and the
+caller can test `grid[index] == OUTSIDE` instead of checking bounds. Positions
+are plain int indices; `index` and `xy` convert to and from coordinates.
+"""
+
+from collections.abc import Iterator
+
+type XY = tuple[int, int]
+
+OUTSIDE: int = 0
+ORTHOGONAL: list[XY] = [
+    (0, -1),  # N
+    (1, 0),  # E
+    (0, 1),  # S
+    (-1, 0),  # W
+]
+ADJACENT: list[XY] = [
+    (0, -1),  # N
+    (1, -1),  # NE
+    (1, 0),  # E
+    (1, 1),  # SE
+    (0, 1),  # S
+    (-1, 1),  # SW
+    (-1, 0),  # W
+    (-1, -1),  # NW
+]
+
+
+class Grid:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        fill: bytes = b".",
+        padding: int = 1,
+    ) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.padding: int = padding
+        self.stride: int = width + 2 * padding
+        self.data: bytearray = bytearray(self.stride * (height + 2 * padding))
+        row: bytes = fill * width
+        for y in range(height):
+            start: int = self.index(0, y)
+            self.data[start : start + width] = row
+        self.orthogonal: list[int] = self.offsets(ORTHOGONAL)
+        self.adjacent: list[int] = self.offsets(ADJACENT)
+
+    @classmethod
+    def from_text(cls, text: str | bytes, padding: int = 1) -> "Grid":
+        if isinstance(text, str):
+            text = text.encode()
+        lines: list[bytes] = text.splitlines()
+        grid: Grid = cls(len(lines[0]), len(lines), padding=padding)
+        for y, line in enumerate(lines):
+            if len(line) != grid.width:
+                raise ValueError(
+                    f"Row {y} has {len(line)} cells, expected {grid.width}"
+                )
+            start: int = grid.index(0, y)
+            grid.data[start : start + grid.width] = line
+        return grid
+
+    def __str__(self) -> str:
+        return "\n".join(row.decode() for row in self.rows())
+
+    def __getitem__(self, index: int) -> int:
+        return self.data[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.data[index] = value
+
+    def __contains__(self, index: int) -> bool:
+        return 0 <= index < len(self.data) and self.data[index] != OUTSIDE
+
+    def index(self, x: int, y: int) -> int:
+        return (y + self.padding) * self.stride + x + self.padding
+
+    def xy(self, index: int) -> XY:
+        y, x = divmod(index, self.stride)
+        return x - self.padding, y - self.padding
+
+    def offset(self, dx: int, dy: int) -> int:
+        return dy * self.stride + dx
+
+    def offsets(self, directions: list[XY]) -> list[int]:
+        return [self.offset(dx, dy) for dx, dy in directions]
+
+    def get(self, x: int, y: int) -> str:
+        return chr(self.data[self.index(x, y)])
+
+    def set(self, x: int, y: int, char: str) -> None:
+        self.data[self.index(x, y)] = ord(char)
+
+    def rows(self) -> Iterator[bytes]:
+        for y in range(self.height):
+            start: int = self.index(0, y)
+            yield bytes(self.data[start : start + self.width])
+
+    def cells(self) -> Iterator[int]:
+        """Indices of every cell on the map, row by row"""
+        for y in range(self.height):
+            start: int = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find(self, char: str) -> int:
+        """Index of the first cell holding char, -1 if there is none"""
+        return self.data.find(ord(char))
+
+    def find_all(self, char: str) -> Iterator[int]:
+        value: int = ord(char)
+        index: int = self.data.find(value)
+        while index != -1:
+            yield index
+            index = self.data.find(value, index + 1)
+
+    def count(self, char: str) -> int:
+        return self.data.count(ord(char))
+
+    def copy(self) -> "Grid":
+        grid: Grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.data = self.data.copy()
+        return grid
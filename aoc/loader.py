@@ -0,0 +1,84 @@
+"""
+Memory mapped input loading.
+
+`mapped` maps an input file read-only so nothing is decoded or copied up front.
+`lines`, `blocks` and `fields` walk the mapping as `memoryview` slices, and
+`ints` parses integers straight from the bytes without building `str` objects,
+so very large inputs stream with flat memory use.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+import os
+import re
+
+type Buffer = bytes | bytearray | mmap | memoryview
+
+INT_PATTERN: re.Pattern[bytes] = re.compile(rb"\d+")
+SIGNED_INT_PATTERN: re.Pattern[bytes] = re.compile(rb"-?\d+")
+FIELD_PATTERN: re.Pattern[bytes] = re.compile(rb"[^\s]+")
+LINE_END_PATTERN: re.Pattern[bytes] = re.compile(rb"\r?\n")
+BLANK_LINE_PATTERN: re.Pattern[bytes] = re.compile(rb"\r?\n\r?\n")
+
+
+@contextmanager
+def mapped(path: Path | str) -> Iterator[mmap | bytes]:
+    """Empty files cannot be mapped so yield empty bytes for those"""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        buffer: mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+    try:
+        yield buffer
+    finally:
+        try:
+            buffer.close()
+        except BufferError:
+            # Slices are still referenced, the mapping goes when they do
+            pass
+
+
+def _split(
+    buffer: Buffer,
+    separator: re.Pattern[bytes],
+) -> Iterator[memoryview]:
+    view: memoryview = memoryview(buffer)
+    start: int = 0
+    for match in separator.finditer(buffer):
+        yield view[start : match.start()]
+        start = match.end()
+    if start < len(view):
+        yield view[start:]
+
+
+def lines(buffer: Buffer) -> Iterator[memoryview]:
+    """Lines without their line endings. A trailing newline adds no line."""
+    return _split(buffer, LINE_END_PATTERN)
+
+
+def blocks(buffer: Buffer) -> Iterator[memoryview]:
+    """Sections separated by blank lines, e.g. rules and updates"""
+    return _split(buffer, BLANK_LINE_PATTERN)
+
+
+def fields(
+    line: Buffer,
+    pattern: re.Pattern[bytes] = FIELD_PATTERN,
+) -> Iterator[bytes]:
+    """Whitespace separated fields unless another field pattern is given"""
+    for match in pattern.finditer(line):
+        yield match[0]
+
+
+def ints(buffer: Buffer, signed: bool = False) -> Iterator[int]:
+    """
+    Every integer in the buffer, in order. A leading '-' is only read as a sign
+    with `signed`, e.g. for 2024/14's velocities, so ranges such as 2025/05's
+    3-5 parse as 3 and 5.
+    """
+    pattern: re.Pattern[bytes] = SIGNED_INT_PATTERN if signed else INT_PATTERN
+    for match in pattern.finditer(buffer):
+        yield int(match[0])
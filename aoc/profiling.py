@@ -0,0 +1,136 @@
+"""
+Profiling reports for a single solution run: a cProfile table sorted by
+cumulative time, the largest tracemalloc allocation sites and the peak RSS.
+Each report uses a fresh run so the instrumentation does not overlap, and the
+RSS is measured in a fresh process since the peak of a process only grows.
+"""
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from pstats import SortKey, Stats
+from types import FrameType
+import cProfile
+import sys
+import tracemalloc
+
+from aoc.runner import Job, jobs
+from aoc.solutions import add_selection_arguments
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_TOP: int = 20
+
+
+def cpu_report(main: Callable[..., object], job: Job, top: int) -> Stats:
+    profiler: cProfile.Profile = cProfile.Profile()
+    profiler.runcall(main, job.input_path, *job.extra_args)
+    stats: Stats = Stats(profiler).sort_stats(SortKey.CUMULATIVE)
+    stats.print_stats(top)
+    return stats
+
+
+def allocation_snapshot(
+    main: Callable[..., object],
+    job: Job,
+) -> tuple[tracemalloc.Snapshot, int]:
+    """
+    The snapshot is taken as main returns, while its locals are still alive,
+    so it shows the working set rather than only what outlives the call.
+    """
+    snapshots: list[tracemalloc.Snapshot] = []
+
+    def on_return(frame: FrameType, event: str, _: object) -> None:
+        if event == "return" and frame.f_code is main.__code__:
+            snapshots.append(tracemalloc.take_snapshot())
+
+    tracemalloc.start()
+    sys.setprofile(on_return)
+    try:
+        main(job.input_path, *job.extra_args)
+    finally:
+        sys.setprofile(None)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return snapshots[-1], peak
+
+
+def memory_report(main: Callable[..., object], job: Job, top: int) -> None:
+    snapshot, peak = allocation_snapshot(main, job)
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(True, str(job.solution.path))]
+    )
+    print(f"Top {top} allocation sites when main returned")
+    for statistic in snapshot.statistics("lineno")[:top]:
+        print(f"  {statistic}")
+    print(f"Traced peak {peak / 1024:.1f} KiB")
+
+
+def peak_rss() -> int | None:
+    """Peak resident set size of this process in bytes"""
+    if resource is None:
+        return None
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_for_rss(job: Job) -> int | None:
+    job.solution.load().main(job.input_path, *job.extra_args)
+    return peak_rss()
+
+
+def job_peak_rss(job: Job) -> int | None:
+    """Peak RSS of a fresh process that imports and runs only this job"""
+    if resource is None:
+        return None
+    # Not spawn: its vfork + exec carries the parent's peak over to the child
+    context: BaseContext = get_context("forkserver")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run_for_rss, job).result()
+
+
+def profile_job(job: Job, top: int, directory: Path | None = None) -> None:
+    print(f"==> {job.solution.name} {job.input_path}")
+    stats: Stats = cpu_report(job.solution.load().main, job, top)
+    if directory is not None:
+        directory.mkdir(parents=True, exist_ok=True)
+        name: str = job.solution.module_name.removeprefix("aoc_")
+        stats.dump_stats(directory / f"{name}_{job.input_path.stem}.pstats")
+    memory_report(job.solution.load().main, job, top)
+    rss: int | None = job_peak_rss(job)
+    if rss is not None:
+        print(f"Peak RSS of a fresh run {rss / 1024 / 1024:.1f} MiB")
+
+
+def add_arguments(parser: ArgumentParser) -> None:
+    add_selection_arguments(parser)
+    parser.add_argument(
+        "-n",
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help="Rows to show in each report",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        help="Also save the cProfile stats of each run as .pstats files here",
+    )
+
+
+def main(args: Namespace) -> int:
+    failures: int = 0
+    for job in jobs(args):
+        try:
+            profile_job(job, args.top, args.output_dir)
+        except Exception as error:
+            failures += 1
+            print(f"error: {type(error).__name__}: {error}")
+    return int(failures > 0)
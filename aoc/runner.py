@@ -0,0 +1,244 @@
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType
+import os
+
+from aoc.cache import (
+    DEFAULT_DIRECTORY,
+    DEFAULT_MAX_BYTES,
+    DISABLE_VARIABLE,
+    AnswerCache,
+)
+from aoc.solutions import Solution, add_selection_arguments, selected
+from aoc.trace import traced
+
+
+class Job:
+    def __init__(
+        self,
+        solution: Solution,
+        input_path: Path,
+        extra_args: list[int] | None = None,
+    ) -> None:
+        self.solution: Solution = solution
+        self.input_path: Path = input_path
+        self.extra_args: list[int] = extra_args or []
+
+    def __repr__(self) -> str:
+        return f"Job({self.solution.name}, {self.input_path.name})"
+
+
+class Result:
+    def __init__(
+        self,
+        job: Job,
+        answer: object = None,
+        seconds: float = 0.0,
+        error: str | None = None,
+        events: dict[str, int] | None = None,
+        cached: bool = False,
+    ) -> None:
+        self.job: Job = job
+        self.answer: object = answer
+        self.seconds: float = seconds
+        self.error: str | None = error
+        self.events: dict[str, int] = events or {}
+        self.cached: bool = cached
+
+    def __str__(self) -> str:
+        outcome: str = str(self.answer)
+        if self.error:
+            outcome = f"error: {self.error}"
+        timing: str = f"{self.seconds * 1000:10.3f} ms"
+        if self.cached:
+            timing = f"{'cached':>13}"
+        return (
+            f"{self.job.solution.name:<24} "
+            f"{self.job.input_path.name:<24} "
+            f"{outcome:<24} "
+            f"{timing}"
+        )
+
+    def to_dict(self) -> dict[str, object]:
+        record: dict[str, object] = {
+            "solution": self.job.solution.name,
+            "input": str(self.job.input_path),
+        }
+        if self.error:
+            record["error"] = self.error
+        else:
+            record["answer"] = self.answer
+            record["seconds"] = self.seconds
+            record["cached"] = self.cached
+        return record
+
+    def trace_lines(self) -> Iterator[str]:
+        """Debug event counts, most frequent first"""
+        ranked: list[tuple[str, int]] = sorted(
+            self.events.items(), key=lambda item: -item[1]
+        )
+        for event, count in ranked:
+            yield f"  {count:>10} {event}"
+
+
+def timed(main: Callable[..., object], job: Job) -> tuple[object, float]:
+    start: float = perf_counter()
+    answer: object = main(job.input_path, *job.extra_args)
+    return answer, perf_counter() - start
+
+
+def run_job(
+    job: Job,
+    cache: AnswerCache | None = None,
+    trace: bool = False,
+) -> Result:
+    """
+    With `trace` the solution always runs and its debug events are counted.
+    A cached answer is returned with `cached` set and no solve time.
+    """
+    events: dict[str, int] = {}
+    try:
+        module: ModuleType = job.solution.load()
+        main: Callable[..., object] = module.main
+        if trace:
+            with traced() as counts:
+                answer, seconds = timed(main, job)
+            events = dict(counts)
+        elif cache is not None:
+            key: str = cache.key(
+                job.solution.path, job.input_path, job.extra_args
+            )
+            found, answer = cache.get(key)
+            if found:
+                return Result(job, answer, cached=True)
+            answer, seconds = timed(main, job)
+            cache.put(key, answer)
+        else:
+            answer, seconds = timed(main, job)
+    except Exception as error:
+        return Result(job, error=f"{type(error).__name__}: {error}")
+    return Result(job, answer, seconds, events=events)
+
+
+def run_isolated(
+    job: Job,
+    cache: AnswerCache | None = None,
+    trace: bool = False,
+) -> Result:
+    """Runs a single job in its own worker process"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(run_job, job, cache, trace).result()
+        except Exception as error:
+            return Result(job, error=f"{type(error).__name__}: {error}")
+
+
+def run_parallel(
+    jobs: Iterable[Job],
+    workers: int,
+    cache: AnswerCache | None = None,
+    trace: bool = False,
+) -> Iterator[Result]:
+    """
+    Runs every job in a process pool, yielding results in submission order.
+    Exceptions raised by a solution are already captured by `run_job`. When a
+    worker dies the whole pool breaks, so the first unfinished job is rerun on
+    its own to find out whether it was the cause, and the jobs after it are
+    resubmitted to a fresh pool.
+    """
+    pending: list[Job] = list(jobs)
+    while pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures: list[tuple[Job, Future[Result]]] = [
+                (job, executor.submit(run_job, job, cache, trace))
+                for job in pending
+            ]
+            for index, (job, future) in enumerate(futures):
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    yield run_isolated(job, cache, trace)
+                    pending = pending[index + 1 :]
+                    break
+                except Exception as error:
+                    yield Result(job, error=f"{type(error).__name__}: {error}")
+            else:
+                pending = []
+
+
+def jobs(args: Namespace) -> Iterator[Job]:
+    for solution, input_path in selected(args):
+        yield Job(solution, input_path, args.extra_args)
+
+
+def add_arguments(parser: ArgumentParser) -> None:
+    add_selection_arguments(parser)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count() or 1,
+        default=1,
+        dest="workers",
+        help="Run in a process pool. Without a value uses every core",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_false",
+        dest="cache",
+        help="Always run the solutions, ignoring cached answers and rules",
+    )
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_DIRECTORY)
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_BYTES,
+        help="Bytes of answers to keep before evicting the least recently used",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Count each solution's debug events. Implies --no-cache",
+    )
+
+
+def main(args: Namespace) -> int:
+    start: float = perf_counter()
+    failures: int = 0
+    busy: float = 0.0
+    cached: int = 0
+    cache: AnswerCache | None = None
+    if args.cache and not args.trace:
+        cache = AnswerCache(args.cache_dir, args.cache_size)
+    else:
+        os.environ[DISABLE_VARIABLE] = "1"
+    if args.workers > 1:
+        results: Iterator[Result] = run_parallel(
+            jobs(args),
+            args.workers,
+            cache,
+            args.trace,
+        )
+    else:
+        run: Callable[[Job], Result] = partial(
+            run_job, cache=cache, trace=args.trace
+        )
+        results: Iterator[Result] = map(run, jobs(args))
+    for result in results:
+        failures += int(result.error is not None)
+        busy += result.seconds
+        cached += int(result.cached)
+        print(result)
+        for line in result.trace_lines():
+            print(line)
+    print(f"Total solve time {busy * 1000:.3f} ms")
+    if cached:
+        print(f"{cached} cached answers not included in the solve time")
+    print(f"Total wall time {(perf_counter() - start) * 1000:.3f} ms")
+    return int(failures > 0)
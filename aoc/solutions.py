@@ -0,0 +1,138 @@
+from argparse import ArgumentParser, Namespace
+from collections.abc import Iterator
+from importlib.machinery import SourceFileLoader
+from glob import glob
+from importlib.util import module_from_spec, spec_from_loader
+from pathlib import Path
+from types import ModuleType
+import sys
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+PART_PREFIX: str = "part_"
+INPUT_DIR: str = "input"
+INPUT_GLOB: str = "*.txt"
+GLOB_CHARS: str = "*?["
+
+
+class Solution:
+    def __init__(self, year: int, day: int, part: str, path: Path) -> None:
+        self.year: int = year
+        self.day: int = day
+        self.part: str = part
+        self.path: Path = path
+
+    def __repr__(self) -> str:
+        return f"Solution({self.name})"
+
+    @classmethod
+    def from_path(cls, path: Path) -> "Solution":
+        """e.g. 2024/11/part_2.py, relative to anywhere"""
+        path = path.resolve()
+        year: int = int(path.parent.parent.name)
+        day: int = int(path.parent.name)
+        return cls(year, day, _part(path), path)
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/{self.day:02d}/{PART_PREFIX}{self.part}"
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc_{self.year}_{self.day:02d}_{PART_PREFIX}{self.part}"
+
+    @property
+    def inputs(self) -> list[Path]:
+        return sorted((self.path.parent / INPUT_DIR).glob(INPUT_GLOB))
+
+    def load(self) -> ModuleType:
+        """
+        Executes the solution file as a fresh module. The 2025 solutions have
+        no file extension so the source loader has to be given explicitly.
+        Every call re-executes the file so module level state (caches,
+        iterators) never leaks between runs.
+        """
+        loader: SourceFileLoader = SourceFileLoader(
+            self.module_name,
+            str(self.path),
+        )
+        spec = spec_from_loader(self.module_name, loader)
+        if spec is None:
+            raise ImportError(f"Unable to load {self.path}")
+        module: ModuleType = module_from_spec(spec)
+        sys.modules[self.module_name] = module
+        loader.exec_module(module)
+        return module
+
+
+def _part(path: Path) -> str:
+    return path.name.removesuffix(".py").removeprefix(PART_PREFIX)
+
+
+def expand_inputs(patterns: list[str]) -> Iterator[Path]:
+    """
+    Each pattern is a file, a directory (every file in it, sorted) or a glob,
+    for when the shell has not already expanded it or the list is too long.
+    """
+    for pattern in patterns:
+        path: Path = Path(pattern)
+        if path.is_dir():
+            yield from sorted(p for p in path.iterdir() if p.is_file())
+        elif any(char in pattern for char in GLOB_CHARS):
+            yield from map(Path, sorted(glob(pattern, recursive=True)))
+        else:
+            yield path
+
+
+def solutions(
+    years: list[int] | None = None,
+    days: list[int] | None = None,
+    parts: list[str] | None = None,
+) -> Iterator[Solution]:
+    for year_dir in sorted(ROOT.glob("[0-9][0-9][0-9][0-9]")):
+        year: int = int(year_dir.name)
+        if years and year not in years:
+            continue
+        for day_dir in sorted(year_dir.glob("[0-9][0-9]")):
+            day: int = int(day_dir.name)
+            if days and day not in days:
+                continue
+            for path in sorted(day_dir.glob(f"{PART_PREFIX}*")):
+                part: str = _part(path)
+                if parts and part not in parts:
+                    continue
+                yield Solution(year, day, part, path)
+
+
+def add_selection_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument("-y", "--year", type=int, nargs="+", dest="years")
+    parser.add_argument("-d", "--day", type=int, nargs="+", dest="days")
+    parser.add_argument(
+        "-p",
+        "--part",
+        nargs="+",
+        dest="parts",
+        help="Part name, e.g. 1, 2 or 1_recursive",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        nargs="+",
+        dest="inputs",
+        help="Input files, directories or globs. Defaults to each day's inputs",
+    )
+    parser.add_argument(
+        "-a",
+        "--arg",
+        type=int,
+        nargs="+",
+        dest="extra_args",
+        default=[],
+        help="Extra positional arguments for main, e.g. blinks for 2024/11",
+    )
+
+
+def selected(args: Namespace) -> Iterator[tuple[Solution, Path]]:
+    inputs: list[Path] = list(expand_inputs(args.inputs or []))
+    for solution in solutions(args.years, args.days, args.parts):
+        for input_path in inputs or solution.inputs:
+            yield solution, input_path
@@ -0,0 +1,41 @@
+"""
+Debug event counting.
+
+The solutions log with lazy %-style arguments, so while the root logger is
+above DEBUG a trace call costs only the level check. `traced` lowers the level
+for one run and counts each record by call site and message template, which
+shows how often a hot path is taken without formatting a single string. Only
+str templates are part of the key, so a message that is not a template cannot
+split one call site into a counter per call.
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+import logging
+
+
+class EventCounter(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.events: Counter[str] = Counter()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        site: str = f"{record.module}:{record.funcName}:{record.lineno}"
+        if isinstance(record.msg, str):
+            site = f"{site}: {record.msg}"
+        self.events[site] += 1
+
+
+@contextmanager
+def traced() -> Iterator[Counter[str]]:
+    root: logging.Logger = logging.getLogger()
+    level: int = root.level
+    counter: EventCounter = EventCounter()
+    root.addHandler(counter)
+    root.setLevel(logging.DEBUG)
+    try:
+        yield counter.events
+    finally:
+        root.setLevel(level)
+        root.removeHandler(counter)